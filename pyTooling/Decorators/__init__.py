@@ -94,9 +94,9 @@ def export(entity: T) -> T:
 	if not hasattr(entity, "__module__"):
 		raise AttributeError(f"{entity} has no __module__ attribute. Please ensure it is a top-level function or class reference defined in a module.")
 
-	if hasattr(entity, "__qualname__"):
-		if any(i in entity.__qualname__ for i in (".", "<locals>", "<lambda>")):
-			raise TypeError(f"Only named top-level functions and classes may be exported, not {entity}")
+	qualifiedName = getattr(entity, "__qualname__", None)
+	if qualifiedName is not None and ("." in qualifiedName or "<locals>" in qualifiedName or "<lambda>" in qualifiedName):
+		raise TypeError(f"Only named top-level functions and classes may be exported, not {entity}")
 
 	if not hasattr(entity, "__name__") or entity.__name__ == "<lambda>":
 		raise TypeError(f"Entity must be a named top-level function or class, not {entity.__class__}")
@@ -550,12 +550,13 @@ class GraphMLDocument(Base):
 			for vertex in pyTGraph.IterateVertices():
 				newNode = Node(vertex._id)
 				newNode.AddData(Data(nodeValue, vertex._value))
-				for key, value in vertex._dict.items():
-					if document.HasKey(str(key)):
-						nodeKey = document.GetKey(f"node{key!s}")
-					else:
-						nodeKey = document.AddKey(Key(f"node{key!s}", AttributeContext.Node, str(key), AttributeTypes.String))
-					newNode.AddData(Data(nodeKey, value))
+				if vertex._dict is not None:
+					for key, value in vertex._dict.items():
+						if document.HasKey(str(key)):
+							nodeKey = document.GetKey(f"node{key!s}")
+						else:
+							nodeKey = document.AddKey(Key(f"node{key!s}", AttributeContext.Node, str(key), AttributeTypes.String))
+						newNode.AddData(Data(nodeKey, value))
 
 				rootGraph.AddNode(newNode)
 
@@ -565,12 +566,13 @@ class GraphMLDocument(Base):
 
 				newEdge = Edge(edge._id, source, target)
 				newEdge.AddData(Data(edgeValue, edge._value))
-				for key, value in edge._dict.items():
-					if self.HasKey(str(key)):
-						edgeKey = self.GetBy(f"edge{key!s}")
-					else:
-						edgeKey = self.AddKey(Key(f"edge{key!s}", AttributeContext.Edge, str(key), AttributeTypes.String))
-					newEdge.AddData(Data(edgeKey, value))
+				if edge._dict is not None:
+					for key, value in edge._dict.items():
+						if self.HasKey(str(key)):
+							edgeKey = self.GetBy(f"edge{key!s}")
+						else:
+							edgeKey = self.AddKey(Key(f"edge{key!s}", AttributeContext.Edge, str(key), AttributeTypes.String))
+						newEdge.AddData(Data(edgeKey, value))
 
 				rootGraph.AddEdge(newEdge)
 
@@ -580,12 +582,13 @@ class GraphMLDocument(Base):
 
 				newEdge = Edge(link._id, source, target)
 				newEdge.AddData(Data(edgeValue, link._value))
-				for key, value in link._dict.items():
-					if self.HasKey(str(key)):
-						edgeKey = self.GetKey(f"link{key!s}")
-					else:
-						edgeKey = self.AddKey(Key(f"link{key!s}", AttributeContext.Edge, str(key), AttributeTypes.String))
-					newEdge.AddData(Data(edgeKey, value))
+				if link._dict is not None:
+					for key, value in link._dict.items():
+						if self.HasKey(str(key)):
+							edgeKey = self.GetKey(f"link{key!s}")
+						else:
+							edgeKey = self.AddKey(Key(f"link{key!s}", AttributeContext.Edge, str(key), AttributeTypes.String))
+						newEdge.AddData(Data(edgeKey, value))
 
 				rootGraph.AddEdge(newEdge)
 
@@ -595,12 +598,13 @@ class GraphMLDocument(Base):
 			for vertex in pyTSubgraph.IterateVertices():
 				newNode = Node(vertex._id)
 				newNode.AddData(Data(nodeValue, vertex._value))
-				for key, value in vertex._dict.items():
-					if self.HasKey(str(key)):
-						nodeKey = self.GetKey(f"node{key!s}")
-					else:
-						nodeKey = self.AddKey(Key(f"node{key!s}", AttributeContext.Node, str(key), AttributeTypes.String))
-					newNode.AddData(Data(nodeKey, value))
+				if vertex._dict is not None:
+					for key, value in vertex._dict.items():
+						if self.HasKey(str(key)):
+							nodeKey = self.GetKey(f"node{key!s}")
+						else:
+							nodeKey = self.AddKey(Key(f"node{key!s}", AttributeContext.Node, str(key), AttributeTypes.String))
+						newNode.AddData(Data(nodeKey, value))
 
 				nodeGraph.AddNode(newNode)
 
@@ -610,12 +614,13 @@ class GraphMLDocument(Base):
 
 				newEdge = Edge(edge._id, source, target)
 				newEdge.AddData(Data(edgeValue, edge._value))
-				for key, value in edge._dict.items():
-					if self.HasKey(str(key)):
-						edgeKey = self.GetKey(f"edge{key!s}")
-					else:
-						edgeKey = self.AddKey(Key(f"edge{key!s}", AttributeContext.Edge, str(key), AttributeTypes.String))
-					newEdge.AddData(Data(edgeKey, value))
+				if edge._dict is not None:
+					for key, value in edge._dict.items():
+						if self.HasKey(str(key)):
+							edgeKey = self.GetKey(f"edge{key!s}")
+						else:
+							edgeKey = self.AddKey(Key(f"edge{key!s}", AttributeContext.Edge, str(key), AttributeTypes.String))
+						newEdge.AddData(Data(edgeKey, value))
 
 				nodeGraph.AddEdge(newEdge)
 
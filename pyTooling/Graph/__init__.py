@@ -53,11 +53,13 @@ starting vertex are provided as methods on a vertex.
 			 classDef node fill:#eee,stroke:#777,font-size:smaller;
 """
 import heapq
+from array       import array
 from collections import deque
-from itertools   import chain
+from itertools   import chain, compress
+from operator    import not_
 from sys         import version_info           # needed for versions before Python 3.11
 from typing      import TypeVar, Generic, List, Tuple, Dict, Set, Deque, Union, Optional as Nullable
-from typing      import Callable, Iterator as typing_Iterator, Generator, Iterable, Mapping, Hashable
+from typing      import Callable, Iterator as typing_Iterator, Generator, Iterable, Mapping, Hashable, Any
 
 try:
 	from pyTooling.Decorators  import export, readonly
@@ -163,6 +165,9 @@ GraphDictKeyType = TypeVar("GraphDictKeyType", bound=Hashable)
 GraphDictValueType = TypeVar("GraphDictValueType")
 """A type variable for a graph's dictionary values."""
 
+_IMMUTABLE_TYPES = (type(None), bool, int, float, complex, str, bytes)
+"""Types whose string representation can't change, so a string derived from them can be cached."""
+
 
 @export
 class GraphException(ToolingException):
@@ -222,7 +227,7 @@ class Base(
 	Generic[DictKeyType, DictValueType],
 	metaclass=ExtendedType, slots=True
 ):
-	_dict: Dict[DictKeyType, DictValueType]  #: A dictionary to store arbitrary key-value-pairs.
+	_dict: Nullable[Dict[DictKeyType, DictValueType]]  #: A dictionary to store arbitrary key-value-pairs. It's allocated on first write.
 
 	def __init__(
 		self,
@@ -233,7 +238,7 @@ class Base(
 
 		:param keyValuePairs: The optional mapping (dictionary) of key-value-pairs.
 		"""
-		self._dict = {key: value for key, value in keyValuePairs.items()} if keyValuePairs is not None else {}
+		self._dict = {key: value for key, value in keyValuePairs.items()} if keyValuePairs is not None else None
 
 	def __del__(self):
 		"""
@@ -252,9 +257,13 @@ class Base(
 		"""
 		Read a vertex's attached attributes (key-value-pairs) by key.
 
-		:param key: The key to look for.
-		:returns:   The value associated to the given key.
+		:param key:       The key to look for.
+		:returns:         The value associated to the given key.
+		:raises KeyError: If key doesn't exist in the vertex's attributes.
 		"""
+		if self._dict is None:
+			raise KeyError(key)
+
 		return self._dict[key]
 
 	def __setitem__(self, key: DictKeyType, value: DictValueType) -> None:
@@ -266,7 +275,10 @@ class Base(
 		:param key: The key to create or update.
 		:param value: The value to associate to the given key.
 		"""
-		self._dict[key] = value
+		if self._dict is None:
+			self._dict = {key: value}
+		else:
+			self._dict[key] = value
 
 	def __delitem__(self, key: DictKeyType) -> None:
 		"""
@@ -275,6 +287,9 @@ class Base(
 		:param key:       The key to remove.
 		:raises KeyError: If key doesn't exist in the vertex's attributes.
 		"""
+		if self._dict is None:
+			raise KeyError(key)
+
 		del self._dict[key]
 
 	def __contains__(self, key: DictKeyType) -> bool:
@@ -284,7 +299,7 @@ class Base(
 		:param key: The key to check.
 		:returns:   ``True``, if the key is an attached attribute.
 		"""
-		return key in self._dict
+		return self._dict is not None and key in self._dict
 
 	def __len__(self) -> int:
 		"""
@@ -292,7 +307,7 @@ class Base(
 
 		:returns: Number of attached attributes.
 		"""
-		return len(self._dict)
+		return len(self._dict) if self._dict is not None else 0
 
 
 @export
@@ -515,14 +530,16 @@ class Vertex(
 	A **vertex** can have a unique ID, a value and attached meta information as key-value-pairs. A vertex has references
 	to inbound and outbound edges, thus a graph can be traversed in reverse.
 	"""
-	_graph:     'BaseGraph[GraphDictKeyType, GraphDictValueType, VertexIDType, VertexWeightType, VertexValueType, VertexDictKeyType, VertexDictValueType, EdgeIDType, EdgeWeightType, EdgeValueType, EdgeDictKeyType, EdgeDictValueType]'  #: Field storing a reference to the graph.
+	_graph:     Nullable['BaseGraph[GraphDictKeyType, GraphDictValueType, VertexIDType, VertexWeightType, VertexValueType, VertexDictKeyType, VertexDictValueType, EdgeIDType, EdgeWeightType, EdgeValueType, EdgeDictKeyType, EdgeDictValueType]']  #: Field storing a reference to the graph, or ``None`` for a standalone vertex.
 	_subgraph:  'Subgraph[GraphDictKeyType, GraphDictValueType, VertexIDType, VertexWeightType, VertexValueType, VertexDictKeyType, VertexDictValueType, EdgeIDType, EdgeWeightType, EdgeValueType, EdgeDictKeyType, EdgeDictValueType]'   #: Field storing a reference to the subgraph.
-	_component: 'Component'
+	_component: Nullable['Component']
 	_views:     Dict[Hashable, 'View']
 	_inboundEdges:   List['Edge[EdgeIDType, EdgeWeightType, EdgeValueType, EdgeDictKeyType, EdgeDictValueType]']  #: Field storing a list of inbound edges.
 	_outboundEdges:  List['Edge[EdgeIDType, EdgeWeightType, EdgeValueType, EdgeDictKeyType, EdgeDictValueType]']  #: Field storing a list of outbound edges.
 	_inboundLinks:   List['Link[EdgeIDType, EdgeWeightType, EdgeValueType, EdgeDictKeyType, EdgeDictValueType]']  #: Field storing a list of inbound links.
 	_outboundLinks:  List['Link[EdgeIDType, EdgeWeightType, EdgeValueType, EdgeDictKeyType, EdgeDictValueType]']  #: Field storing a list of outbound links.
+	_index:          int  #: Field storing the vertex' index in the CSR adjacency of a frozen graph.
+	_repr:           Nullable[str]  #: Field caching the result of :meth:`__repr__`, if ID and value are of an immutable type.
 
 	def __init__(
 		self,
@@ -552,16 +569,13 @@ class Vertex(
 		super().__init__(vertexID, value, weight, keyValuePairs)
 
 		if subgraph is None:
-			self._graph = graph if graph is not None else Graph()
 			self._subgraph = None
-			self._component = Component(self._graph, vertices=(self,))
-
-			if vertexID is None:
-				self._graph._verticesWithoutID.append(self)
-			elif vertexID not in self._graph._verticesWithID:
-				self._graph._verticesWithID[vertexID] = self
+			if graph is None:
+				# A graph is created on demand, when the vertex gets connected or when the graph is accessed.
+				self._graph = None
+				self._component = None
 			else:
-				raise DuplicateVertexError(f"Vertex ID '{vertexID}' already exists in this graph.")
+				graph._RegisterVertex(self)
 		else:
 			self._graph = subgraph._graph
 			self._subgraph = subgraph
@@ -579,6 +593,8 @@ class Vertex(
 		self._outboundEdges = []
 		self._inboundLinks =  []
 		self._outboundLinks = []
+		self._index =         -1
+		self._repr =          None
 
 	def __del__(self):
 		"""
@@ -610,10 +626,13 @@ class Vertex(
 			link._source._outboundLinks.remove(link)
 			link._Delete()
 
-		if self._id is None:
-			self._graph._verticesWithoutID.remove(self)
-		else:
-			del self._graph._verticesWithID[self._id]
+		if self._graph is not None:
+			if self._id is None:
+				self._graph._verticesWithoutID.remove(self)
+			else:
+				del self._graph._verticesWithID[self._id]
+
+			self._graph._Unfreeze()
 
 		# subgraph
 
@@ -634,8 +653,13 @@ class Vertex(
 		"""
 		Read-only property to access the graph, this vertex is associated to (:attr:`_graph`).
 
+		If the vertex was created without a graph, a new graph is created on first access.
+
 		:returns: The graph this vertex is associated to.
 		"""
+		if self._graph is None:
+			Graph()._RegisterVertex(self)
+
 		return self._graph
 
 	@readonly
@@ -645,8 +669,37 @@ class Vertex(
 
 		:returns: The component this vertex is associated to.
 		"""
+		if self._graph is None:
+			Graph()._RegisterVertex(self)
+
 		return self._component
 
+	@property
+	def Value(self) -> VertexValueType:
+		"""
+		Property to get and set the value (:attr:`_value`) of a vertex.
+
+		:returns: The value of a vertex.
+		"""
+		return self._value
+
+	@Value.setter
+	def Value(self, value: VertexValueType) -> None:
+		self._value = value
+		self._repr = None
+
+	@readonly
+	def Index(self) -> Nullable[int]:
+		"""
+		Read-only property to access the vertex' index (:attr:`_index`) in the CSR representation of a frozen graph.
+
+		:returns: The vertex' index, if the graph is frozen, otherwise ``None``.
+		"""
+		if self._graph is None or self._graph._csrOffsets is None or self._subgraph is not None:
+			return None
+
+		return self._index
+
 	@readonly
 	def InboundEdges(self) -> Tuple['Edge', ...]:
 		"""
@@ -795,6 +848,22 @@ class Vertex(
 		"""
 		return tuple([edge.Destination for edge in self._outboundEdges])
 
+	def _JoinGraph(self, vertex: 'Vertex') -> None:
+		"""
+		Register this vertex or the referenced vertex in the other vertex' graph, if it wasn't associated to a graph yet.
+
+		If both vertices have no graph, a new graph is created for both vertices.
+
+		:param vertex: The vertex to be connected with.
+		"""
+		if self._graph is None:
+			if vertex._graph is None:
+				Graph()._RegisterVertex(vertex)
+			if self._graph is None:
+				vertex._graph._RegisterVertex(self)
+		elif vertex._graph is None:
+			self._graph._RegisterVertex(vertex)
+
 	def EdgeToVertex(
 		self,
 		vertex: 'Vertex',
@@ -829,12 +898,25 @@ class Vertex(
 		.. todo:: GRAPH::Vertex::EdgeToVertex Needs possible exceptions to be documented.
 		"""
 		if self._subgraph is vertex._subgraph:
-			edge = Edge(self, vertex, edgeID, edgeValue, edgeWeight, keyValuePairs)
+			if self._graph is None or vertex._graph is None:
+				# Check all parameters before a standalone vertex joins the other vertex' graph, so a failing call leaves the
+				# graph unchanged.
+				Edge._CheckIDAndWeight(edgeID, edgeWeight)
+				graph = self._graph if self._graph is not None else vertex._graph
+				if edgeID is not None and graph is not None and edgeID in graph._edgesWithID:
+					raise DuplicateEdgeError(f"Edge ID '{edgeID}' already exists in this graph.")
+
+				self._JoinGraph(vertex)
+				edge = Edge._NewUnchecked(self, vertex, edgeID, edgeValue, edgeWeight, keyValuePairs)
+			else:
+				edge = Edge(self, vertex, edgeID, edgeValue, edgeWeight, keyValuePairs)
 
 			self._outboundEdges.append(edge)
 			vertex._inboundEdges.append(edge)
 
 			if self._subgraph is None:
+				self._graph._Unfreeze()
+
 				# TODO: move into Edge?
 				# TODO: keep _graph pointer in edge and then register edge on graph?
 				if edgeID is None:
@@ -891,12 +973,25 @@ class Vertex(
 		.. todo:: GRAPH::Vertex::EdgeFromVertex Needs possible exceptions to be documented.
 		"""
 		if self._subgraph is vertex._subgraph:
-			edge = Edge(vertex, self, edgeID, edgeValue, edgeWeight, keyValuePairs)
+			if self._graph is None or vertex._graph is None:
+				# Check all parameters before a standalone vertex joins the other vertex' graph, so a failing call leaves the
+				# graph unchanged.
+				Edge._CheckIDAndWeight(edgeID, edgeWeight)
+				graph = self._graph if self._graph is not None else vertex._graph
+				if edgeID is not None and graph is not None and edgeID in graph._edgesWithID:
+					raise DuplicateEdgeError(f"Edge ID '{edgeID}' already exists in this graph.")
+
+				self._JoinGraph(vertex)
+				edge = Edge._NewUnchecked(vertex, self, edgeID, edgeValue, edgeWeight, keyValuePairs)
+			else:
+				edge = Edge(vertex, self, edgeID, edgeValue, edgeWeight, keyValuePairs)
 
 			vertex._outboundEdges.append(edge)
 			self._inboundEdges.append(edge)
 
 			if self._subgraph is None:
+				self._graph._Unfreeze()
+
 				# TODO: move into Edge?
 				# TODO: keep _graph pointer in edge and then register edge on graph?
 				if edgeID is None:
@@ -958,34 +1053,30 @@ class Vertex(
 
 		.. todo:: GRAPH::Vertex::EdgeToNewVertex Needs possible exceptions to be documented.
 		"""
-		vertex = Vertex(vertexID, vertexValue, vertexWeight, vertexKeyValuePairs, graph=self._graph)  # , component=self._component)
+		if self._subgraph is not None:
+			# FIXME: needs an error message
+			raise GraphException()
 
-		if self._subgraph is vertex._subgraph:
-			edge = Edge(self, vertex, edgeID, edgeValue, edgeWeight, edgeKeyValuePairs)
+		# Check all parameters before the new vertex is added to this vertex' component, so a failing call leaves the graph
+		# unchanged.
+		graph = self.Graph
+		Edge._CheckIDAndWeight(edgeID, edgeWeight)
+		if edgeID is not None and edgeID in graph._edgesWithID:
+			raise DuplicateEdgeError(f"Edge ID '{edgeID}' already exists in this graph.")
 
-			self._outboundEdges.append(edge)
-			vertex._inboundEdges.append(edge)
+		# The new vertex is registered directly in this vertex' component, so the edge doesn't need to merge components.
+		vertex = Vertex(vertexID, vertexValue, vertexWeight, vertexKeyValuePairs)
+		graph._RegisterVertex(vertex, self._component)
 
-			if self._subgraph is None:
-				# TODO: move into Edge?
-				# TODO: keep _graph pointer in edge and then register edge on graph?
-				if edgeID is None:
-					self._graph._edgesWithoutID.append(edge)
-				elif edgeID not in self._graph._edgesWithID:
-					self._graph._edgesWithID[edgeID] = edge
-				else:
-					raise DuplicateEdgeError(f"Edge ID '{edgeID}' already exists in this graph.")
-			else:
-				# TODO: keep _graph pointer in edge and then register edge on graph?
-				if edgeID is None:
-					self._subgraph._edgesWithoutID.append(edge)
-				elif edgeID not in self._graph._edgesWithID:
-					self._subgraph._edgesWithID[edgeID] = edge
-				else:
-					raise DuplicateEdgeError(f"Edge ID '{edgeID}' already exists in this graph.")
+		edge = Edge._NewUnchecked(self, vertex, edgeID, edgeValue, edgeWeight, edgeKeyValuePairs)
+
+		self._outboundEdges.append(edge)
+		vertex._inboundEdges.append(edge)
+
+		if edgeID is None:
+			graph._edgesWithoutID.append(edge)
 		else:
-			# FIXME: needs an error message
-			raise GraphException()
+			graph._edgesWithID[edgeID] = edge
 
 		return edge
 
@@ -1028,34 +1119,30 @@ class Vertex(
 
 		.. todo:: GRAPH::Vertex::EdgeFromNewVertex Needs possible exceptions to be documented.
 		"""
-		vertex = Vertex(vertexID, vertexValue, vertexWeight, vertexKeyValuePairs, graph=self._graph)  # , component=self._component)
+		if self._subgraph is not None:
+			# FIXME: needs an error message
+			raise GraphException()
 
-		if self._subgraph is vertex._subgraph:
-			edge = Edge(vertex, self, edgeID, edgeValue, edgeWeight, edgeKeyValuePairs)
+		# Check all parameters before the new vertex is added to this vertex' component, so a failing call leaves the graph
+		# unchanged.
+		graph = self.Graph
+		Edge._CheckIDAndWeight(edgeID, edgeWeight)
+		if edgeID is not None and edgeID in graph._edgesWithID:
+			raise DuplicateEdgeError(f"Edge ID '{edgeID}' already exists in this graph.")
 
-			vertex._outboundEdges.append(edge)
-			self._inboundEdges.append(edge)
+		# The new vertex is registered directly in this vertex' component, so the edge doesn't need to merge components.
+		vertex = Vertex(vertexID, vertexValue, vertexWeight, vertexKeyValuePairs)
+		graph._RegisterVertex(vertex, self._component)
 
-			if self._subgraph is None:
-				# TODO: move into Edge?
-				# TODO: keep _graph pointer in edge and then register edge on graph?
-				if edgeID is None:
-					self._graph._edgesWithoutID.append(edge)
-				elif edgeID not in self._graph._edgesWithID:
-					self._graph._edgesWithID[edgeID] = edge
-				else:
-					raise DuplicateEdgeError(f"Edge ID '{edgeID}' already exists in this graph.")
-			else:
-				# TODO: keep _graph pointer in edge and then register edge on graph?
-				if edgeID is None:
-					self._subgraph._edgesWithoutID.append(edge)
-				elif edgeID not in self._graph._edgesWithID:
-					self._subgraph._edgesWithID[edgeID] = edge
-				else:
-					raise DuplicateEdgeError(f"Edge ID '{edgeID}' already exists in this graph.")
+		edge = Edge._NewUnchecked(vertex, self, edgeID, edgeValue, edgeWeight, edgeKeyValuePairs)
+
+		vertex._outboundEdges.append(edge)
+		self._inboundEdges.append(edge)
+
+		if edgeID is None:
+			graph._edgesWithoutID.append(edge)
 		else:
-			# FIXME: needs an error message
-			raise GraphException()
+			graph._edgesWithID[edgeID] = edge
 
 		return edge
 
@@ -1329,13 +1416,13 @@ class Vertex(
 			raise GraphException("Graph to copy this vertex to, is the same graph.")
 
 		vertex = Vertex(self._id, self._value, self._weight, graph=graph)
-		if copyDict:
+		if copyDict and self._dict is not None:
 			vertex._dict = self._dict.copy()
 
 		if linkingKeyToOriginalVertex is not None:
-			vertex._dict[linkingKeyToOriginalVertex] = self
+			vertex[linkingKeyToOriginalVertex] = self
 		if linkingKeyFromOriginalVertex is not None:
-			self._dict[linkingKeyFromOriginalVertex] = vertex
+			self[linkingKeyFromOriginalVertex] = vertex
 
 		return vertex
 
@@ -1413,10 +1500,21 @@ class Vertex(
 
 		If parameter ``predicate`` is not None, the given filter function is used to skip successors in the generator.
 
+		If the graph is frozen (see :meth:`Graph.Freeze <pyTooling.Graph.Graph.Freeze>`) and no predicate is given, the
+		successors are read from the graph's CSR adjacency arrays.
+
 		:param predicate: Filter function accepting any edge and returning a boolean.
 		:returns:         A generator to iterate all successor vertices.
 		"""
 		if predicate is None:
+			graph = self._graph
+			if graph is not None and graph._csrOffsets is not None and self._subgraph is None:
+				vertices = graph._vertexByIndex
+				offsets = graph._csrOffsets
+				for neighbor in graph._csrNeighbors[offsets[self._index]:offsets[self._index + 1]]:
+					yield vertices[neighbor]
+				return
+
 			for edge in self._outboundEdges:
 				yield edge.Destination
 		else:
@@ -1430,10 +1528,21 @@ class Vertex(
 
 		If parameter ``predicate`` is not None, the given filter function is used to skip predecessors in the generator.
 
+		If the graph is frozen (see :meth:`Graph.Freeze <pyTooling.Graph.Graph.Freeze>`) and no predicate is given, the
+		predecessors are read from the graph's reverse CSR adjacency arrays.
+
 		:param predicate: Filter function accepting any edge and returning a boolean.
 		:returns:         A generator to iterate all predecessor vertices.
 		"""
 		if predicate is None:
+			graph = self._graph
+			if graph is not None and graph._csrInboundOffsets is not None and self._subgraph is None:
+				vertices = graph._vertexByIndex
+				offsets = graph._csrInboundOffsets
+				for neighbor in graph._csrInboundNeighbors[offsets[self._index]:offsets[self._index + 1]]:
+					yield vertices[neighbor]
+				return
+
 			for edge in self._inboundEdges:
 				yield edge.Source
 		else:
@@ -1445,6 +1554,9 @@ class Vertex(
 		"""
 		A generator to iterate all reachable vertices starting from this node in breadth-first search (BFS) order.
 
+		If the graph is frozen (see :meth:`Graph.Freeze <pyTooling.Graph.Graph.Freeze>`), the traversal operates on integer
+		vertex indices and the graph's CSR adjacency arrays.
+
 		:returns: A generator to iterate vertices traversed in BFS order.
 
 		.. seealso::
@@ -1452,30 +1564,50 @@ class Vertex(
 		   :meth:`IterateVerticesDFS` |br|
 		      |rarr| Iterate all reachable vertices **depth-first search** order.
 		"""
-		visited: Set[Vertex] = set()
-		queue: Deque[Vertex] = deque()
+		graph = self._graph
+		if graph is not None and graph._csrOffsets is not None and self._subgraph is None:
+			vertices = graph._vertexByIndex
+			offsets = graph._csrOffsets
+			neighbors = graph._csrNeighbors
+			visited = bytearray(len(vertices))
+			# Each vertex is enqueued at most once, thus a preallocated array with head and tail positions suffices as queue.
+			indexQueue = array("I", [0]) * len(vertices)
+			head = 0
+			tail = 1
+
+			visited[self._index] = 1
+			indexQueue[0] = self._index
+			while head != tail:
+				index = indexQueue[head]
+				head += 1
+				yield vertices[index]
+				for neighbor in neighbors[offsets[index]:offsets[index + 1]]:
+					if not visited[neighbor]:
+						visited[neighbor] = 1
+						indexQueue[tail] = neighbor
+						tail += 1
+			return
 
-		yield self
-		visited.add(self)
-		for edge in self._outboundEdges:
-			nextVertex = edge.Destination
-			if nextVertex is not self:
-				queue.appendleft(nextVertex)
-				visited.add(nextVertex)
+		visited: Set[Vertex] = {self}
+		queue: Deque[Vertex] = deque()
 
+		queue.appendleft(self)
 		while queue:
 			vertex = queue.pop()
 			yield vertex
 			for edge in vertex._outboundEdges:
-				nextVertex = edge.Destination
+				nextVertex = edge._destination
 				if nextVertex not in visited:
+					visited.add(nextVertex)
 					queue.appendleft(nextVertex)
-				visited.add(nextVertex)
 
 	def IterateVerticesDFS(self) -> Generator['Vertex', None, None]:
 		"""
 		A generator to iterate all reachable vertices starting from this node in depth-first search (DFS) order.
 
+		If the graph is frozen (see :meth:`Graph.Freeze <pyTooling.Graph.Graph.Freeze>`), visited vertices are tracked by
+		their integer vertex index and neighbors are read from the graph's CSR adjacency arrays.
+
 		:returns: A generator to iterate vertices traversed in DFS order.
 
 		.. seealso::
@@ -1485,6 +1617,35 @@ class Vertex(
 
 		   Wikipedia - https://en.wikipedia.org/wiki/Depth-first_search
 		"""
+		graph = self._graph
+		if graph is not None and graph._csrOffsets is not None and self._subgraph is None:
+			vertices = graph._vertexByIndex
+			offsets = graph._csrOffsets
+			neighbors = graph._csrNeighbors
+			visited = bytearray(len(vertices))
+			# Parallel stacks of vertex indices and their next read position in the CSR neighbor array.
+			stackIndex: List[int] = [self._index]
+			stackPosition: List[int] = [offsets[self._index]]
+
+			yield self
+			visited[self._index] = 1
+
+			while stackIndex:
+				position = stackPosition[-1]
+				if position < offsets[stackIndex[-1] + 1]:
+					stackPosition[-1] = position + 1
+					neighbor = neighbors[position]
+					if not visited[neighbor]:
+						visited[neighbor] = 1
+						yield vertices[neighbor]
+						stackIndex.append(neighbor)
+						stackPosition.append(offsets[neighbor])
+				else:
+					stackIndex.pop()
+					stackPosition.pop()
+
+			return
+
 		visited: Set[Vertex] = set()
 		stack: List[typing_Iterator[Edge]] = list()
 
@@ -1554,6 +1715,9 @@ class Vertex(
 		The search algorithm is breadth-first search (BFS) based. The found solution, if any, is not unique but deterministic
 		as long as the graph was not modified (e.g. ordering of edges on vertices).
 
+		If the graph is frozen (see :meth:`Graph.Freeze <pyTooling.Graph.Graph.Freeze>`), the search tree is stored as a flat
+		array of parent vertex indices instead of linked node objects.
+
 		:param destination: The destination vertex to reach.
 		:returns:           A generator to iterate all vertices on the path found between this vertex and the destination vertex.
 		"""
@@ -1562,6 +1726,44 @@ class Vertex(
 			yield self
 			return
 
+		graph = self._graph
+		if graph is not None and graph._csrOffsets is not None and self._subgraph is None and destination._graph is graph and destination._subgraph is None:
+			vertices = graph._vertexByIndex
+			offsets = graph._csrOffsets
+			neighbors = graph._csrNeighbors
+			startIndex = self._index
+			destinationIndex = destination._index
+
+			# Parent index per vertex index; -1 marks vertices not yet visited.
+			parents = array("i", [-1]) * len(vertices)
+			parents[startIndex] = startIndex
+			indexQueue: Deque[int] = deque()
+			indexQueue.append(startIndex)
+
+			while indexQueue:
+				index = indexQueue.popleft()
+				for neighbor in neighbors[offsets[index]:offsets[index + 1]]:
+					if parents[neighbor] == -1:
+						parents[neighbor] = index
+						if neighbor == destinationIndex:
+							break
+						indexQueue.append(neighbor)
+				# Next 3 lines realize a double-break if break was called in inner loop, otherwise continue with outer loop.
+				else:
+					continue
+				break
+			else:
+				# All reachable vertices have been processed, but destination was not among them.
+				raise DestinationNotReachable(f"Destination is not reachable.")
+
+			path = [destinationIndex]
+			while path[-1] != startIndex:
+				path.append(parents[path[-1]])
+
+			for index in reversed(path):
+				yield vertices[index]
+			return
+
 		# Local struct to create multiple linked-lists forming a paths from current node back to the starting point
 		# (actually a tree). Each node holds a reference to the vertex it represents.
 		# Hint: slotted classes are faster than '@dataclasses.dataclass'.
@@ -1643,6 +1845,9 @@ class Vertex(
 		The search algorithm is based on Dijkstra algorithm and using :mod:`heapq`. The found solution, if any, is not
 		unique but deterministic as long as the graph was not modified (e.g. ordering of edges on vertices).
 
+		If the graph is frozen (see :meth:`Graph.Freeze <pyTooling.Graph.Graph.Freeze>`), the search operates on integer
+		vertex indices and reads edge weights from a cached list parallel to the graph's CSR adjacency arrays.
+
 		:param destination: The destination vertex to reach.
 		:returns:           A generator to iterate all vertices on the path found between this vertex and the destination vertex.
 		"""
@@ -1673,45 +1878,94 @@ class Vertex(
 			def __str__(self):
 				return f"Vertex: {self.ref.ID}"
 
-		visited: Set['Vertex'] = set()
-		startNode = Node(None, 0, self)
-		priorityQueue = [startNode]
+		graph = self._graph
+		if graph is not None and graph._csrOffsets is not None and self._subgraph is None and destination._graph is graph and destination._subgraph is None:
+			# Same search on integer vertex indices, reading neighbors and edge weights from the graph's CSR arrays. Nodes
+			# reference vertex indices, which are replaced by vertices along the found path.
+			vertices = graph._vertexByIndex
+			offsets = graph._csrOffsets
+			neighbors = graph._csrNeighbors
+			weights = graph._GetCSRWeights()
+			heappush = heapq.heappush
+			heappop = heapq.heappop
+			startIndex = self._index
+			destinationIndex = destination._index
+			visited = bytearray(len(vertices))
+			startNode = Node(None, 0, startIndex)
+			priorityQueue = [startNode]
+
+			visited[startIndex] = 1
+			for position in range(offsets[startIndex], offsets[startIndex + 1]):
+				nextIndex = neighbors[position]
+				if nextIndex == destinationIndex:
+					destinationNode = Node(startNode, weights[position], nextIndex)
+					break
+				if nextIndex != startIndex:
+					visited[nextIndex] = 1
+					heappush(priorityQueue, Node(startNode, weights[position], nextIndex))
+			else:
+				while priorityQueue:
+					node = heappop(priorityQueue)
+					index = node.ref
+					distance = node.distance
+					for position in range(offsets[index], offsets[index + 1]):
+						nextIndex = neighbors[position]
+						if nextIndex == destinationIndex:
+							destinationNode = Node(node, distance + weights[position], nextIndex)
+							break
+						if not visited[nextIndex]:
+							visited[nextIndex] = 1
+							heappush(priorityQueue, Node(node, distance + weights[position], nextIndex))
+					else:
+						continue
+					break
+				else:
+					raise DestinationNotReachable(f"Destination is not reachable.")
 
-		# Add starting vertex and all its children to the processing list.
-		# If a child is the destination, break immediately else go into 'else' branch and use Dijkstra algorithm.
-		visited.add(self)
-		for edge in self._outboundEdges:
-			nextVertex = edge.Destination
-			# Child is destination, so construct the last node for path traversal and break from loop.
-			if nextVertex is destination:
-				destinationNode = Node(startNode, edge._weight, nextVertex)
-				break
-			# Ignore backward-edges and side-edges.
-			# Here self-edges, because there is only the starting vertex in the list of visited edges.
-			if nextVertex is not self:
-				visited.add(nextVertex)
-				heapq.heappush(priorityQueue, Node(startNode, edge._weight, nextVertex))
+			node = destinationNode
+			while node is not None:
+				node.ref = vertices[node.ref]
+				node = node.parent
 		else:
-			# Process priority queue until destination is found or no further vertices are reachable.
-			while priorityQueue:
-				node = heapq.heappop(priorityQueue)
-				for edge in node.ref._outboundEdges:
-					nextVertex = edge.Destination
-					# Next reachable vertex is destination, so construct the last node for path traversal and break from loop.
-					if nextVertex is destination:
-						destinationNode = Node(node, node.distance + edge._weight, nextVertex)
-						break
-					# Ignore backward-edges and side-edges.
-					if nextVertex not in visited:
-						visited.add(nextVertex)
-						heapq.heappush(priorityQueue, Node(node, node.distance + edge._weight, nextVertex))
-				# Next 3 lines realize a double-break if break was called in inner loop, otherwise continue with outer loop.
-				else:
-					continue
-				break
+			visited: Set['Vertex'] = set()
+			startNode = Node(None, 0, self)
+			priorityQueue = [startNode]
+
+			# Add starting vertex and all its children to the processing list.
+			# If a child is the destination, break immediately else go into 'else' branch and use Dijkstra algorithm.
+			visited.add(self)
+			for edge in self._outboundEdges:
+				nextVertex = edge.Destination
+				# Child is destination, so construct the last node for path traversal and break from loop.
+				if nextVertex is destination:
+					destinationNode = Node(startNode, edge._weight, nextVertex)
+					break
+				# Ignore backward-edges and side-edges.
+				# Here self-edges, because there is only the starting vertex in the list of visited edges.
+				if nextVertex is not self:
+					visited.add(nextVertex)
+					heapq.heappush(priorityQueue, Node(startNode, edge._weight, nextVertex))
 			else:
-				# All reachable vertices have been processed, but destination was not among them.
-				raise DestinationNotReachable(f"Destination is not reachable.")
+				# Process priority queue until destination is found or no further vertices are reachable.
+				while priorityQueue:
+					node = heapq.heappop(priorityQueue)
+					for edge in node.ref._outboundEdges:
+						nextVertex = edge.Destination
+						# Next reachable vertex is destination, so construct the last node for path traversal and break from loop.
+						if nextVertex is destination:
+							destinationNode = Node(node, node.distance + edge._weight, nextVertex)
+							break
+						# Ignore backward-edges and side-edges.
+						if nextVertex not in visited:
+							visited.add(nextVertex)
+							heapq.heappush(priorityQueue, Node(node, node.distance + edge._weight, nextVertex))
+					# Next 3 lines realize a double-break if break was called in inner loop, otherwise continue with outer loop.
+					else:
+						continue
+					break
+				else:
+					# All reachable vertices have been processed, but destination was not among them.
+					raise DestinationNotReachable(f"Destination is not reachable.")
 
 		# Reverse order of linked-list from destinationNode to startNode
 		currentNode = destinationNode
@@ -1757,7 +2011,8 @@ class Vertex(
 		stack: List[Tuple[Node, typing_Iterator[Edge]]] = list()
 
 		root = Node(nodeID=self._id, value=self._value)
-		root._dict = self._dict.copy()
+		if self._dict is not None:
+			root._dict = self._dict.copy()
 
 		visited.add(self)
 		stack.append((root, iter(self._outboundEdges)))
@@ -1788,6 +2043,9 @@ class Vertex(
 
 		:returns: The detailed string representation of the vertex.
 		"""
+		if self._repr is not None:
+			return self._repr
+
 		vertexID = value = ""
 		sep = ": "
 		if self._id is not None:
@@ -1796,7 +2054,12 @@ class Vertex(
 		if self._value is not None:
 			value = f"{sep}value='{self._value}'"
 
-		return f"<vertex{vertexID}{value}>"
+		result = f"<vertex{vertexID}{value}>"
+		# Only cache the representation, if neither ID nor value can change their string representation in-place.
+		if type(self._id) in _IMMUTABLE_TYPES and type(self._value) in _IMMUTABLE_TYPES:
+			self._repr = result
+
+		return result
 
 	def __str__(self) -> str:
 		"""
@@ -1858,6 +2121,9 @@ class BaseEdge(
 		if component is not destination._component:
 			# TODO: should it be divided into with/without ID?
 			oldComponent = destination._component
+			# Merge the smaller component into the larger one, so building a graph edge by edge doesn't become quadratic.
+			if len(oldComponent._vertices) > len(component._vertices):
+				component, oldComponent = oldComponent, component
 			for vertex in oldComponent._vertices:
 				vertex._component = component
 				component._vertices.add(vertex)
@@ -1918,32 +2184,74 @@ class Edge(
 		:param weight:        The optional weight for the new edge.
 		:param keyValuePairs: The optional mapping (dictionary) of key-value-pairs.
 		"""
-		if not isinstance(source, Vertex):
-			ex = TypeError("Parameter 'source' is not of type 'Vertex'.")
-			if version_info >= (3, 11):  # pragma: no cover
-				ex.add_note(f"Got type '{getFullyQualifiedName(source)}'.")
-			raise ex
-		if not isinstance(destination, Vertex):
-			ex = TypeError("Parameter 'destination' is not of type 'Vertex'.")
-			if version_info >= (3, 11):  # pragma: no cover
-				ex.add_note(f"Got type '{getFullyQualifiedName(destination)}'.")
-			raise ex
+		# Vertex type checks are skipped, if Python runs in optimized mode (option '-O').
+		if __debug__:
+			if not isinstance(source, Vertex):
+				ex = TypeError("Parameter 'source' is not of type 'Vertex'.")
+				if version_info >= (3, 11):  # pragma: no cover
+					ex.add_note(f"Got type '{getFullyQualifiedName(source)}'.")
+				raise ex
+			if not isinstance(destination, Vertex):
+				ex = TypeError("Parameter 'destination' is not of type 'Vertex'.")
+				if version_info >= (3, 11):  # pragma: no cover
+					ex.add_note(f"Got type '{getFullyQualifiedName(destination)}'.")
+				raise ex
+		# if value is not None and  not isinstance(value, Vertex):
+		# 	raise TypeError("Parameter 'value' is not of type 'EdgeValueType'.")
+		self._CheckIDAndWeight(edgeID, weight)
+		if source._graph is not destination._graph or source._graph is None:
+			raise NotInSameGraph(f"Source vertex and destination vertex are not in same graph.")
+
+		super().__init__(source, destination, edgeID, value, weight, keyValuePairs)
+
+	@staticmethod
+	def _CheckIDAndWeight(edgeID: Nullable[EdgeIDType], weight: Nullable[EdgeWeightType]) -> None:
+		"""
+		Check the types of an edge's optional ID and weight.
+
+		:param edgeID:     The optional unique ID for an edge.
+		:param weight:     The optional weight for an edge.
+		:raises TypeError: If parameter 'edgeID' is not hashable.
+		:raises TypeError: If parameter 'weight' is not of type 'int' or 'float'.
+		"""
 		if edgeID is not None and not isinstance(edgeID, Hashable):
 			ex = TypeError("Parameter 'edgeID' is not of type 'EdgeIDType'.")
 			if version_info >= (3, 11):  # pragma: no cover
 				ex.add_note(f"Got type '{getFullyQualifiedName(edgeID)}'.")
 			raise ex
-		# if value is not None and  not isinstance(value, Vertex):
-		# 	raise TypeError("Parameter 'value' is not of type 'EdgeValueType'.")
 		if weight is not None and not isinstance(weight, (int, float)):
 			ex = TypeError("Parameter 'weight' is not of type 'EdgeWeightType'.")
 			if version_info >= (3, 11):  # pragma: no cover
 				ex.add_note(f"Got type '{getFullyQualifiedName(weight)}'.")
 			raise ex
-		if source._graph is not destination._graph:
-			raise NotInSameGraph(f"Source vertex and destination vertex are not in same graph.")
 
-		super().__init__(source, destination, edgeID, value, weight, keyValuePairs)
+	@classmethod
+	def _NewUnchecked(
+		cls,
+		source: Vertex,
+		destination: Vertex,
+		edgeID: Nullable[EdgeIDType] = None,
+		value: Nullable[EdgeValueType] = None,
+		weight: Nullable[EdgeWeightType] = None,
+		keyValuePairs: Nullable[Mapping[DictKeyType, DictValueType]] = None
+	) -> 'Edge':
+		"""
+		Create a new edge, skipping all parameter checks.
+
+		The caller must guarantee that ``source`` and ``destination`` are vertices of the same graph and that ``edgeID``
+		and ``weight`` are valid. The new edge is not registered at vertices, graph or subgraph.
+
+		:param source:        The source of the new edge.
+		:param destination:   The destination of the new edge.
+		:param edgeID:        The optional unique ID for the new edge.
+		:param value:         The optional value for the new edge.
+		:param weight:        The optional weight for the new edge.
+		:param keyValuePairs: The optional mapping (dictionary) of key-value-pairs.
+		:returns:             The new unregistered edge.
+		"""
+		edge = cls.__new__(cls)
+		BaseEdge.__init__(edge, source, destination, edgeID, value, weight, keyValuePairs)
+		return edge
 
 	def Delete(self) -> None:
 		# Remove from Source and Destination
@@ -1951,6 +2259,7 @@ class Edge(
 		self._destination._inboundEdges.remove(self)
 
 		# Remove from Graph and Subgraph
+		self._source._graph._Unfreeze()
 		if self._id is None:
 			self._source._graph._edgesWithoutID.remove(self)
 			if self._source._subgraph is not None:
@@ -1965,8 +2274,23 @@ class Edge(
 	def _Delete(self) -> None:
 		super().Delete()
 
+	@property
+	def Weight(self) -> Nullable[EdgeWeightType]:
+		"""
+		Property to get and set the weight (:attr:`_weight`) of an edge.
+
+		:returns: The weight of an edge.
+		"""
+		return self._weight
+
+	@Weight.setter
+	def Weight(self, value: Nullable[EdgeWeightType]) -> None:
+		self._weight = value
+		self._source._graph._InvalidateWeights()
+
 	def Reverse(self) -> None:
 		"""Reverse the direction of this edge."""
+		self._source._graph._Unfreeze()
 		self._source._outboundEdges.remove(self)
 		self._source._inboundEdges.append(self)
 		self._destination._inboundEdges.remove(self)
@@ -2004,16 +2328,18 @@ class Link(
 		:param weight:        The optional weight for the new link.
 		:param keyValuePairs: The optional mapping (dictionary) of key-value-pairs.
 		"""
-		if not isinstance(source, Vertex):
-			ex = TypeError("Parameter 'source' is not of type 'Vertex'.")
-			if version_info >= (3, 11):  # pragma: no cover
-				ex.add_note(f"Got type '{getFullyQualifiedName(source)}'.")
-			raise ex
-		if not isinstance(destination, Vertex):
-			ex = TypeError("Parameter 'destination' is not of type 'Vertex'.")
-			if version_info >= (3, 11):  # pragma: no cover
-				ex.add_note(f"Got type '{getFullyQualifiedName(destination)}'.")
-			raise ex
+		# Vertex type checks are skipped, if Python runs in optimized mode (option '-O').
+		if __debug__:
+			if not isinstance(source, Vertex):
+				ex = TypeError("Parameter 'source' is not of type 'Vertex'.")
+				if version_info >= (3, 11):  # pragma: no cover
+					ex.add_note(f"Got type '{getFullyQualifiedName(source)}'.")
+				raise ex
+			if not isinstance(destination, Vertex):
+				ex = TypeError("Parameter 'destination' is not of type 'Vertex'.")
+				if version_info >= (3, 11):  # pragma: no cover
+					ex.add_note(f"Got type '{getFullyQualifiedName(destination)}'.")
+				raise ex
 		if linkID is not None and not isinstance(linkID, Hashable):
 			ex = TypeError("Parameter 'linkID' is not of type 'LinkIDType'.")
 			if version_info >= (3, 11):  # pragma: no cover
@@ -2026,7 +2352,7 @@ class Link(
 			if version_info >= (3, 11):  # pragma: no cover
 				ex.add_note(f"Got type '{getFullyQualifiedName(weight)}'.")
 			raise ex
-		if source._graph is not destination._graph:
+		if source._graph is not destination._graph or source._graph is None:
 			raise NotInSameGraph(f"Source vertex and destination vertex are not in same graph.")
 
 		super().__init__(source, destination, linkID, value, weight, keyValuePairs)
@@ -2761,6 +3087,16 @@ class Graph(
 	_subgraphs:         Set[Subgraph[SubgraphDictKeyType, SubgraphDictValueType, VertexIDType, VertexWeightType, VertexValueType, VertexDictKeyType, VertexDictValueType, EdgeIDType, EdgeWeightType, EdgeValueType, EdgeDictKeyType, EdgeDictValueType, LinkIDType, LinkWeightType, LinkValueType, LinkDictKeyType, LinkDictValueType]]
 	_views:             Set[View[ViewDictKeyType, ViewDictValueType, GraphDictKeyType, GraphDictValueType, VertexIDType, VertexWeightType, VertexValueType, VertexDictKeyType, VertexDictValueType, EdgeIDType, EdgeWeightType, EdgeValueType, EdgeDictKeyType, EdgeDictValueType, LinkIDType, LinkWeightType, LinkValueType, LinkDictKeyType, LinkDictValueType]]
 	_components:        Set[Component[ComponentDictKeyType, ComponentDictValueType, GraphDictKeyType, GraphDictValueType, VertexIDType, VertexWeightType, VertexValueType, VertexDictKeyType, VertexDictValueType, EdgeIDType, EdgeWeightType, EdgeValueType, EdgeDictKeyType, EdgeDictValueType, LinkIDType, LinkWeightType, LinkValueType, LinkDictKeyType, LinkDictValueType]]
+	_vertexByIndex:     Nullable[List[Vertex]]  #: Field storing all vertices ordered by their index in the CSR adjacency.
+	_edgeByIndex:       Nullable[List[Edge]]    #: Field storing all edges ordered by their position in :attr:`_csrNeighbors`.
+	_csrOffsets:        Nullable[List[int]]     #: Field storing the CSR row offsets (``VertexCount + 1`` entries) into :attr:`_csrNeighbors`.
+	_csrNeighbors:      Nullable[List[int]]     #: Field storing the CSR destination vertex indices of all edges.
+	_csrInboundOffsets:   Nullable[List[int]]   #: Field storing the reverse CSR row offsets (``VertexCount + 1`` entries) into :attr:`_csrInboundNeighbors`.
+	_csrInboundNeighbors: Nullable[List[int]]   #: Field storing the reverse CSR source vertex indices of all edges.
+	_inDegrees:         Nullable[List[int]]     #: Field storing the number of inbound edges per vertex index.
+	_outDegrees:        Nullable[List[int]]     #: Field storing the number of outbound edges per vertex index.
+	_csrWeights:        Nullable[List[EdgeWeightType]]  #: Field caching the weights of all edges ordered like :attr:`_csrNeighbors`.
+	_scipyCSR:          Nullable[Tuple[float, Any]]  #: Field caching the last SciPy CSR matrix created by :meth:`ToScipyCSR` together with its default weight.
 
 	def __init__(
 		self,
@@ -2779,6 +3115,17 @@ class Graph(
 		self._views = set()
 		self._components = set()
 
+		self._vertexByIndex = None
+		self._edgeByIndex = None
+		self._csrOffsets = None
+		self._csrNeighbors = None
+		self._csrInboundOffsets = None
+		self._csrInboundNeighbors = None
+		self._inDegrees = None
+		self._outDegrees = None
+		self._csrWeights = None
+		self._scipyCSR = None
+
 	def __del__(self):
 		"""
 		.. todo:: GRAPH::Graph::del Needs documentation.
@@ -2788,6 +3135,16 @@ class Graph(
 			del self._subgraphs
 			del self._views
 			del self._components
+			del self._vertexByIndex
+			del self._edgeByIndex
+			del self._csrOffsets
+			del self._csrNeighbors
+			del self._csrInboundOffsets
+			del self._csrInboundNeighbors
+			del self._inDegrees
+			del self._outDegrees
+			del self._csrWeights
+			del self._scipyCSR
 		except AttributeError:
 			pass
 
@@ -2835,15 +3192,333 @@ class Graph(
 		:returns: The number of components in this graph."""
 		return len(self._components)
 
+	@readonly
+	def IsFrozen(self) -> bool:
+		"""Read-only property to check if the graph's adjacency is frozen into CSR arrays.
+
+		:returns: ``True``, if :meth:`Freeze` was called and the graph wasn't modified afterwards."""
+		return self._csrOffsets is not None
+
+	def Freeze(self) -> None:
+		"""
+		Freeze the graph's adjacency into a compressed sparse row (CSR) representation.
+
+		Each vertex of the graph gets an integer index. All outbound edges are then stored as flat integer arrays:
+		:attr:`_csrNeighbors` holds the destination index of every edge and :attr:`_csrOffsets` holds the position of each
+		vertex' first outbound edge in :attr:`_csrNeighbors`. The order of outbound edges per vertex is preserved.
+
+		In addition, inbound edges are stored as a reverse CSR representation in :attr:`_csrInboundNeighbors` and
+		:attr:`_csrInboundOffsets`, so predecessors can be found without following :class:`Edge` objects.
+
+		Traversal algorithms use these arrays instead of following :class:`Edge` objects, as long as the graph is frozen.
+		Any modification of vertices or edges unfreezes the graph. Vertices in subgraphs are not part of the CSR
+		representation.
+
+		.. seealso::
+
+		   :attr:`IsFrozen` |br|
+		      |rarr| Check if the graph is frozen.
+		   :meth:`ReorderByRCM` |br|
+		      |rarr| Renumber vertex indices of a frozen graph for better memory locality.
+		"""
+		self._BuildCSR(list(chain(self._verticesWithoutID, self._verticesWithID.values())))
+
+	def ReorderByRCM(self) -> None:
+		"""
+		Renumber the vertex indices of the CSR representation using the reverse Cuthill-McKee (RCM) algorithm.
+
+		Vertices are numbered in breadth-first order per connected component, starting from a vertex with minimal degree.
+		Unvisited neighbors are appended ordered by ascending degree, then the overall numbering is reversed. Edge directions
+		are ignored and in- plus out-degree is used as a vertex' degree. This reduces the bandwidth of the adjacency matrix,
+		so neighboring vertices get nearby indices, which improves memory locality of traversals on large graphs.
+
+		Only vertex indices change. The order of outbound and inbound edges per vertex is preserved, therefore all traversal
+		results stay the same. If the graph isn't frozen yet, it's frozen first.
+
+		.. seealso::
+
+		   :meth:`Freeze` |br|
+		      |rarr| Freeze the graph's adjacency into a CSR representation.
+		   Wikipedia - https://en.wikipedia.org/wiki/Cuthill%E2%80%93McKee_algorithm
+		"""
+		if self._csrOffsets is None:
+			self.Freeze()
+
+		vertices = self._vertexByIndex
+		offsets = self._csrOffsets
+		neighbors = self._csrNeighbors
+		inboundOffsets = self._csrInboundOffsets
+		inboundNeighbors = self._csrInboundNeighbors
+
+		vertexCount = len(vertices)
+		degrees = [offsets[i + 1] - offsets[i] + inboundOffsets[i + 1] - inboundOffsets[i] for i in range(vertexCount)]
+		visited = bytearray(vertexCount)
+		order: List[int] = []
+
+		for startIndex in sorted(range(vertexCount), key=degrees.__getitem__):
+			if visited[startIndex]:
+				continue
+
+			visited[startIndex] = 1
+			head = len(order)
+			order.append(startIndex)
+			while head < len(order):
+				index = order[head]
+				head += 1
+
+				level = []
+				for neighbor in chain(neighbors[offsets[index]:offsets[index + 1]], inboundNeighbors[inboundOffsets[index]:inboundOffsets[index + 1]]):
+					if not visited[neighbor]:
+						visited[neighbor] = 1
+						level.append(neighbor)
+
+				level.sort(key=degrees.__getitem__)
+				order.extend(level)
+
+		self._BuildCSR([vertices[index] for index in reversed(order)])
+
+	def _BuildCSR(self, vertices: List[Vertex]) -> None:
+		"""
+		Build the forward and reverse CSR arrays, numbering the given vertices by their position in the list.
+
+		:param vertices: All vertices of the graph in the order of their new index.
+		"""
+		for index, vertex in enumerate(vertices):
+			vertex._index = index
+
+		# CSR arrays are plain lists of int: reading an element from an 'array.array' allocates a new int object, which makes
+		# traversals slower than following edge objects.
+		edges = []
+		offsets = [0] * (len(vertices) + 1)
+		for index, vertex in enumerate(vertices, start=1):
+			edges.extend(vertex._outboundEdges)
+			offsets[index] = len(edges)
+
+		self._vertexByIndex = vertices
+		self._edgeByIndex = edges
+		self._csrOffsets = offsets
+		self._csrNeighbors = [edge._destination._index for edge in edges]
+
+		inboundNeighbors = []
+		inboundOffsets = [0] * (len(vertices) + 1)
+		for index, vertex in enumerate(vertices, start=1):
+			inboundNeighbors.extend(edge._source._index for edge in vertex._inboundEdges)
+			inboundOffsets[index] = len(inboundNeighbors)
+
+		self._csrInboundOffsets = inboundOffsets
+		self._csrInboundNeighbors = inboundNeighbors
+		self._inDegrees = [len(vertex._inboundEdges) for vertex in vertices]
+		self._outDegrees = [len(vertex._outboundEdges) for vertex in vertices]
+		self._csrWeights = None
+		self._scipyCSR = None
+
+	def _RegisterVertex(self, vertex: Vertex, component: Nullable[Component] = None) -> None:
+		"""
+		Register a vertex, which isn't associated to a graph yet, in this graph.
+
+		If no component is given, the vertex gets its own component.
+
+		:param vertex:                The vertex to register.
+		:param component:             The optional component of this graph, the vertex is added to.
+		:raises DuplicateVertexError: If the vertex' ID already exists in this graph.
+		"""
+		if vertex._id is not None and vertex._id in self._verticesWithID:
+			raise DuplicateVertexError(f"Vertex ID '{vertex._id}' already exists in this graph.")
+
+		vertex._graph = self
+		if component is None:
+			vertex._component = Component(self, vertices=(vertex,))
+		else:
+			vertex._component = component
+			component._vertices.add(vertex)
+
+		if vertex._id is None:
+			self._verticesWithoutID.append(vertex)
+		else:
+			self._verticesWithID[vertex._id] = vertex
+
+		self._Unfreeze()
+
+	def _Unfreeze(self) -> None:
+		"""Drop the CSR representation, because the graph's vertices or edges are modified."""
+		self._vertexByIndex = None
+		self._edgeByIndex = None
+		self._csrOffsets = None
+		self._csrNeighbors = None
+		self._csrInboundOffsets = None
+		self._csrInboundNeighbors = None
+		self._inDegrees = None
+		self._outDegrees = None
+		self._csrWeights = None
+		self._scipyCSR = None
+
+	def _InvalidateWeights(self) -> None:
+		"""Drop cached data derived from edge weights, because an edge's weight was modified."""
+		self._csrWeights = None
+		self._scipyCSR = None
+
+	def _GetCSRWeights(self) -> List[EdgeWeightType]:
+		"""
+		Return the weights of all edges in the order of the CSR neighbor array.
+
+		The list is created on first use and cached until the graph or an edge's weight is modified.
+
+		:returns: List of edge weights parallel to :attr:`_csrNeighbors`.
+		"""
+		if self._csrWeights is None:
+			self._csrWeights = [edge._weight for edge in self._edgeByIndex]
+
+		return self._csrWeights
+
+	def ToScipyCSR(self, defaultWeight: float = 1.0) -> Any:
+		"""
+		Export the graph's adjacency as a :class:`scipy.sparse.csr_matrix`.
+
+		Row and column indices are the vertex indices of the frozen graph (see :attr:`Vertex.Index <pyTooling.Graph.Vertex.Index>`), matrix entries are the
+		edge weights. Parallel edges are collapsed into a single entry holding the minimal weight, because scipy would sum up
+		duplicate entries. The resulting matrix can be passed to algorithms in :mod:`scipy.sparse.csgraph` like ``dijkstra``,
+		``connected_components`` or ``minimum_spanning_tree``.
+
+		If the graph isn't frozen yet, it's frozen first. The matrix is cached until the graph or an edge's weight is modified.
+		Each call returns a copy of the cached matrix, so modifying the result doesn't affect later calls.
+
+		.. hint::
+
+		   This method requires the optional dependency ``scipy``.
+
+		:param defaultWeight: Weight used for edges without a weight.
+		:returns:             A sparse matrix of shape ``(VertexCount, VertexCount)``.
+		:raises Exception:    If the optional dependency ``scipy`` is not installed.
+		"""
+		try:
+			from numpy        import asarray, int32
+			from scipy.sparse import csr_matrix
+		except ImportError as ex:  # pragma: no cover
+			raise Exception(f"Optional dependency 'scipy' not installed. Either install pyTooling with extra dependencies 'pyTooling[graph]' or install 'scipy' directly.") from ex
+
+		if self._csrOffsets is None:
+			self.Freeze()
+		elif self._scipyCSR is not None and self._scipyCSR[0] == defaultWeight:
+			return self._scipyCSR[1].copy()
+
+		offsets = self._csrOffsets
+		neighbors = self._csrNeighbors
+		weights = self._GetCSRWeights()
+		vertexCount = len(self._vertexByIndex)
+
+		# Keep one entry per (row, column) with the minimal weight of all parallel edges.
+		matrixOffsets = [0]
+		matrixNeighbors = []
+		matrixWeights = []
+		for index in range(vertexCount):
+			row = {}
+			for position in range(offsets[index], offsets[index + 1]):
+				neighbor = neighbors[position]
+				weight = weights[position]
+				if weight is None:
+					weight = defaultWeight
+				if neighbor not in row or weight < row[neighbor]:
+					row[neighbor] = weight
+			matrixNeighbors.extend(row.keys())
+			matrixWeights.extend(row.values())
+			matrixOffsets.append(len(matrixNeighbors))
+
+		matrix = csr_matrix(
+			(matrixWeights, asarray(matrixNeighbors, dtype=int32), asarray(matrixOffsets, dtype=int32)),
+			shape=(vertexCount, vertexCount)
+		)
+
+		self._scipyCSR = (defaultWeight, matrix)
+		return matrix.copy()
+
+	def ReverseEdges(self, predicate: Nullable[Callable[[Edge], bool]] = None) -> None:
+		"""
+		Reverse all or selected edges of a graph.
+
+		If parameter ``predicate`` is not None, the given filter function is used to skip edges.
+
+		:param predicate: Filter function accepting any edge and returning a boolean.
+		"""
+		self._Unfreeze()
+		super().ReverseEdges(predicate)
+
+	def RemoveEdges(self, predicate: Nullable[Callable[[Edge], bool]] = None):
+		"""
+		Remove all or selected edges of a graph.
+
+		If parameter ``predicate`` is not None, the given filter function is used to skip edges.
+
+		:param predicate: Filter function accepting any edge and returning a boolean.
+		"""
+		self._Unfreeze()
+		super().RemoveEdges(predicate)
+
+	def IterateRoots(self, predicate: Nullable[Callable[[Vertex], bool]] = None) -> Generator[Vertex[GraphDictKeyType, GraphDictValueType, VertexIDType, VertexWeightType, VertexValueType, VertexDictKeyType, VertexDictValueType, EdgeIDType, EdgeWeightType, EdgeValueType, EdgeDictKeyType, EdgeDictValueType, LinkIDType, LinkWeightType, LinkValueType, LinkDictKeyType, LinkDictValueType], None, None]:
+		"""
+		Iterate all or selected roots (vertices without inbound edges / without predecessors) of a graph.
+
+		If parameter ``predicate`` is not None, the given filter function is used to skip vertices in the generator.
+
+		If the graph is frozen, roots are selected by the precomputed in-degree per vertex index and returned in index order.
+
+		:param predicate: Filter function accepting any vertex and returning a boolean.
+		:returns:         A generator to iterate all vertices without inbound edges.
+		"""
+		if self._inDegrees is None:
+			yield from super().IterateRoots(predicate)
+		elif predicate is None:
+			yield from compress(self._vertexByIndex, map(not_, self._inDegrees))
+		else:
+			for vertex in compress(self._vertexByIndex, map(not_, self._inDegrees)):
+				if predicate(vertex):
+					yield vertex
+
+	def IterateLeafs(self, predicate: Nullable[Callable[[Vertex], bool]] = None) -> Generator[Vertex[GraphDictKeyType, GraphDictValueType, VertexIDType, VertexWeightType, VertexValueType, VertexDictKeyType, VertexDictValueType, EdgeIDType, EdgeWeightType, EdgeValueType, EdgeDictKeyType, EdgeDictValueType, LinkIDType, LinkWeightType, LinkValueType, LinkDictKeyType, LinkDictValueType], None, None]:
+		"""
+		Iterate all or selected leafs (vertices without outbound edges / without successors) of a graph.
+
+		If parameter ``predicate`` is not None, the given filter function is used to skip vertices in the generator.
+
+		If the graph is frozen, leafs are selected by the precomputed out-degree per vertex index and returned in index order.
+
+		:param predicate: Filter function accepting any vertex and returning a boolean.
+		:returns:         A generator to iterate all vertices without outbound edges.
+		"""
+		if self._outDegrees is None:
+			yield from super().IterateLeafs(predicate)
+		elif predicate is None:
+			yield from compress(self._vertexByIndex, map(not_, self._outDegrees))
+		else:
+			for vertex in compress(self._vertexByIndex, map(not_, self._outDegrees)):
+				if predicate(vertex):
+					yield vertex
+
 	def __iter__(self) -> typing_Iterator[Vertex[GraphDictKeyType, GraphDictValueType, VertexIDType, VertexWeightType, VertexValueType, VertexDictKeyType, VertexDictValueType, EdgeIDType, EdgeWeightType, EdgeValueType, EdgeDictKeyType, EdgeDictValueType, LinkIDType, LinkWeightType, LinkValueType, LinkDictKeyType, LinkDictValueType]]:
 		"""
-		.. todo:: GRAPH::Graph::iter Needs documentation.
+		Returns an iterator to iterate all vertices of the graph.
+
+		If the graph is frozen (see :meth:`Freeze`), vertices are iterated in order of their vertex index.
 
+		:returns: An iterator over all vertices.
 		"""
-		def gen():
-			yield from self._verticesWithoutID
-			yield from self._verticesWithID
-		return iter(gen())
+		if self._vertexByIndex is not None:
+			return iter(self._vertexByIndex)
+
+		return chain(self._verticesWithoutID, self._verticesWithID.values())
+
+	def HasVertex(self, vertex: Vertex) -> bool:
+		"""
+		Check if a vertex is a vertex of this graph.
+
+		.. note::
+
+		   The membership test operator ``in`` checks the graph's attached key-value-pairs, thus this method is provided to
+		   check for a vertex in constant time.
+
+		:param vertex: The vertex to check.
+		:returns:      ``True``, if the vertex is associated to this graph, but not to a subgraph.
+		"""
+		return vertex._graph is self and vertex._subgraph is None
 
 	def GetVertexByID(self, vertexID: Nullable[VertexIDType]) -> Vertex:
 		"""
@@ -2875,6 +3550,43 @@ class Graph(
 			except IndexError:
 				raise KeyError(f"Found no vertex with Value == `{value}`.")
 
+	def AddEdgesBulk(self, pairs: Iterable[Tuple[VertexIDType, VertexIDType]], weight: Nullable[EdgeWeightType] = None) -> None:
+		"""
+		Create edges without ID between vertices of this graph referenced by pairs of vertex IDs.
+
+		This is a fast path for bulk graph construction, e.g. when loading edge lists. Each vertex ID is resolved once per
+		pair and edges are created without the per-edge parameter checks of :meth:`Vertex.EdgeToVertex`.
+
+		:param pairs:           An iterable of ``(sourceID, destinationID)`` tuples.
+		:param weight:          The optional weight for all new edges.
+		:raises TypeError:      If parameter ``weight`` is not of type int or float.
+		:raises KeyError:       If a vertex ID is not found in this graph.
+
+		.. seealso::
+
+		   :meth:`Vertex.EdgeToVertex <pyTooling.Graph.Vertex.EdgeToVertex>` |br|
+		      |rarr| Create an outbound edge from a vertex to the referenced vertex.
+		"""
+		if weight is not None and not isinstance(weight, (int, float)):
+			ex = TypeError("Parameter 'weight' is not of type 'EdgeWeightType'.")
+			if version_info >= (3, 11):  # pragma: no cover
+				ex.add_note(f"Got type '{getFullyQualifiedName(weight)}'.")
+			raise ex
+
+		self._Unfreeze()
+
+		vertices = self._verticesWithID
+		edges = self._edgesWithoutID
+		newEdge = Edge._NewUnchecked
+		for sourceID, destinationID in pairs:
+			source = vertices[sourceID]
+			destination = vertices[destinationID]
+
+			edge = newEdge(source, destination, None, None, weight)
+			source._outboundEdges.append(edge)
+			destination._inboundEdges.append(edge)
+			edges.append(edge)
+
 	def CopyGraph(self) -> 'Graph':
 		raise NotImplementedError()
 
@@ -2889,30 +3601,30 @@ class Graph(
 		:param copyVertexDict: If ``True``, copy all vertex attached attributes into the new vertices.
 		"""
 		graph = Graph(self._name)
-		if copyGraphDict:
+		if copyGraphDict and self._dict is not None:
 			graph._dict = self._dict.copy()
 
 		if predicate is None:
 			for vertex in self._verticesWithoutID:
 				v = Vertex(None, vertex._value, graph=graph)
-				if copyVertexDict:
+				if copyVertexDict and vertex._dict is not None:
 					v._dict = vertex._dict.copy()
 
 			for vertexID, vertex in self._verticesWithID.items():
 				v = Vertex(vertexID, vertex._value, graph=graph)
-				if copyVertexDict:
+				if copyVertexDict and vertex._dict is not None:
 					v._dict = vertex._dict.copy()
 		else:
 			for vertex in self._verticesWithoutID:
 				if predicate(vertex):
 					v = Vertex(None, vertex._value, graph=graph)
-					if copyVertexDict:
+					if copyVertexDict and vertex._dict is not None:
 						v._dict = vertex._dict.copy()
 
 			for vertexID, vertex in self._verticesWithID.items():
 				if predicate(vertex):
 					v = Vertex(vertexID, vertex._value, graph=graph)
-					if copyVertexDict:
+					if copyVertexDict and vertex._dict is not None:
 						v._dict = vertex._dict.copy()
 
 		return graph
@@ -803,9 +803,12 @@ class ExtendedType(type):
 				if hasattr(baseClass, "__abstractMethods__"):
 					abstractMethods.update(baseClass.__abstractMethods__)
 
+			# Look up only inherited abstract method names in the base-classes' namespaces instead of scanning all members.
 			for base in baseClasses:
-				for key, value in base.__dict__.items():
-					if (key in abstractMethods and isinstance(value, FunctionType) and
+				baseMembers = base.__dict__
+				for key in abstractMethods:
+					value = baseMembers.get(key)
+					if (isinstance(value, FunctionType) and
 						not (hasattr(value, "__abstract__") or hasattr(value, "__mustOverride__"))):
 						def outer(method):
 							@wraps(method)
@@ -907,9 +910,12 @@ class ExtendedType(type):
 			if hasattr(oldnew, "__raises_abstract_class_error__"):
 				oldnew = oldnew.__wrapped__
 
+			# The list of abstract methods is fixed after class creation, thus join their names only once.
+			abstractMethodNames = "', '".join(newClass.__abstractMethods__)
+
 			@wraps(oldnew)
 			def abstract_new(cls, *_, **__):
-				raise AbstractClassError(f"""Class '{cls.__name__}' is abstract. The following methods: '{"', '".join(newClass.__abstractMethods__)}' need to be overridden in a derived class.""")
+				raise AbstractClassError(f"Class '{cls.__name__}' is abstract. The following methods: '{abstractMethodNames}' need to be overridden in a derived class.")
 
 			abstract_new.__raises_abstract_class_error__ = True
 
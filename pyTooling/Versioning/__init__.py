@@ -34,8 +34,8 @@ Implementation of semantic and date versioning version-numbers.
 .. hint:: See :ref:`high-level help <VERSIONING>` for explanations and usage examples.
 """
 from enum   import IntEnum
-from sys    import version_info           # needed for versions before Python 3.11
-from typing import Optional as Nullable, Any
+from re     import compile as re_compile
+from typing import Optional as Nullable, Any, Tuple
 
 try:
 	from pyTooling.Decorators  import export, readonly
@@ -51,6 +51,9 @@ except (ImportError, ModuleNotFoundError):  # pragma: no cover
 		raise ex
 
 
+_VERSION_REGEXP = re_compile(r"(?:rev|REV|[VvIiRr])?(\d+)(?:\.(\d+)(?:\.(\d+)(?:\.(\d+))?)?)?")  #: Precompiled regular expression for parsing a version string.
+
+
 @export
 class Parts(IntEnum):
 	"""Enumeration of parts in a version number that can be presents."""
@@ -84,16 +87,20 @@ class Version(metaclass=ExtendedType, slots=True):
 class SemanticVersion(Version):
 	"""Representation of a semantic version number like ``3.7.12``."""
 
-	_parts   : Parts = Parts.Unknown  #: Integer flag enumeration of present parts in a version number.
-	_flags   : int = Flags.Clean      #: State if the version in a working directory is clean or dirty compared to a tagged version.
-	_major   : int = 0                #: Major number part of the version number.
-	_minor   : int = 0                #: Minor number part of the version number.
-	_patch   : int = 0                #: Patch number part of the version number.
-	_build   : int = 0                #: Build number part of the version number.
-	_pre     : int = 0                #: Pre-release version number part.
-	_post    : int = 0                #: Post-release version number part.
-	_prefix  : str = ""               #: Prefix string
-	_postfix : str = ""               #: Postfix string
+	_parts   : Parts                      #: Integer flag enumeration of present parts in a version number.
+	_flags   : int                        #: State if the version in a working directory is clean or dirty compared to a tagged version.
+	_major   : int                        #: Major number part of the version number.
+	_minor   : int                        #: Minor number part of the version number.
+	_patch   : int                        #: Patch number part of the version number.
+	_build   : int                        #: Build number part of the version number.
+	_pre     : int                        #: Pre-release version number part.
+	_post    : int                        #: Post-release version number part.
+	_prefix  : str                        #: Prefix string
+	_postfix : str                        #: Postfix string
+	_key     : Tuple[int, int, int, int]  #: Tuple of major, minor, patch and build number used for comparisons.
+	_hash    : Nullable[int]              #: Cached hash value computed from :attr:`_key`.
+	_repr    : Nullable[str]              #: Cached string representation without prefix.
+	_str     : Nullable[str]              #: Cached string representation with prefix ``v``.
 # QUESTION: was this how many commits a version is ahead of the last tagged version?
 #	ahead   : int = 0
 
@@ -102,8 +109,16 @@ class SemanticVersion(Version):
 		self._minor = minor
 		self._patch = patch
 		self._build = build
+		self._pre = 0
+		self._post = 0
+		self._prefix = ""
+		self._postfix = ""
 		self._parts = Parts.Minor | Parts.Minor | Parts.Patch | Parts.Build
 		self._flags = flags
+		self._key = (major, minor, patch, build)
+		self._hash = None
+		self._repr = None
+		self._str = None
 
 	@classmethod
 	def Parse(cls, versionString : str) -> "SemanticVersion":
@@ -111,30 +126,19 @@ class SemanticVersion(Version):
 			raise ValueError("Parameter 'versionString' is empty.")
 		elif versionString is None:
 			raise ValueError("Parameter 'versionString' is None.")
-		elif versionString.startswith(("V", "v", "I", "i", "R", "r")):
-			versionString = versionString[1:]
-		elif versionString.startswith(("rev", "REV")):
-			versionString = versionString[3:]
-
-		split = versionString.split(".")
-		length = len(split)
-		major = int(split[0])
-		minor = 0
-		patch = 0
-		build = 0
-		parts = Parts.Major
-		if length >= 2:
-			minor = int(split[1])
-			parts |= Parts.Minor
-		if length >= 3:
-			patch = int(split[2])
-			parts |= Parts.Patch
-		if length >= 4:
-			build = int(split[3])
-			parts |= Parts.Build
-		flags = Flags.Clean
-
-		return cls(major, minor, patch, build, flags)
+
+		match = _VERSION_REGEXP.fullmatch(versionString)
+		if match is None:
+			raise ValueError(f"Parameter 'versionString' is not a valid version number: '{versionString}'.")
+
+		major, minor, patch, build = match.groups()
+		return cls(
+			int(major),
+			int(minor) if minor is not None else 0,
+			int(patch) if patch is not None else 0,
+			int(build) if build is not None else 0,
+			Flags.Clean
+		)
 
 	@readonly
 	def Major(self) -> int:
@@ -164,153 +168,105 @@ class SemanticVersion(Version):
 		"""
 		Compare two Version instances (version numbers) for equality.
 
-		:param other:      Parameter to compare against.
-		:returns:          ``True``, if both version numbers are equal.
-		:raises TypeError: If parameter ``other`` is not of type :class:`SemanticVersion`.
+		:param other: Parameter to compare against.
+		:returns:     ``True``, if both version numbers are equal. |br|
+		              :data:`NotImplemented`, if parameter ``other`` is not of type :class:`SemanticVersion`.
 		"""
 		if not isinstance(other, SemanticVersion):
-			ex = TypeError(f"Second operand of type '{other.__class__.__name__}' is not supported by == operator.")
-			if version_info >= (3, 11):  # pragma: no cover
-				ex.add_note(f"Supported types for second operand: SemanticVersion")
-			raise ex
-
-		return (
-			(self._major == other._major) and
-			(self._minor == other._minor) and
-			(self._patch == other._patch) and
-			(self._build == other._build)
-		)
+			return NotImplemented
 
-	def __ne__(self, other: Any) -> bool:
-		"""
-		Compare two Version instances (version numbers) for inequality.
+		return self._key == other._key
 
-		:param other:      Parameter to compare against.
-		:returns:          ``True``, if both version numbers are not equal.
-		:raises TypeError: If parameter ``other`` is not of type :class:`SemanticVersion`.
+	def __hash__(self) -> int:
 		"""
-		if not isinstance(other, SemanticVersion):
-			ex = TypeError(f"Second operand of type '{other.__class__.__name__}' is not supported by != operator.")
-			if version_info >= (3, 11):  # pragma: no cover
-				ex.add_note(f"Supported types for second operand: SemanticVersion")
-			raise ex
-
-		return not self.__eq__(other)
+		Return a hash value computed from major, minor, patch and build number.
 
-	@staticmethod
-	def __compare(left: 'SemanticVersion', right: 'SemanticVersion') -> Nullable[bool]:
-		"""
-		Private helper method to compute the comparison of two :class:`SemanticVersion` instances.
+		The hash value is computed on first access and cached, because version numbers are immutable.
 
-		:param left:  Left parameter.
-		:param right: Right parameter.
-		:returns:     ``True``, if ``left`` is smaller than ``right``. |br|
-		              False if ``left`` is greater than ``right``. |br|
-		              Otherwise it's None (both parameters are equal).
+		:returns: Hash value of the version number.
 		"""
-		if left._major < right._major:
-			return True
-		elif left._major > right._major:
-			return False
-
-		if left._minor < right._minor:
-			return True
-		elif left._minor > right._minor:
-			return False
-
-		if left._patch < right._patch:
-			return True
-		elif left._patch > right._patch:
-			return False
-
-		if left._build < right._build:
-			return True
-		elif left._build > right._build:
-			return False
+		if self._hash is None:
+			self._hash = hash(self._key)
 
-		return None
+		return self._hash
 
 	def __lt__(self, other: Any) -> bool:
 		"""
 		Compare two Version instances (version numbers) if the version is less than the second operand.
 
-		:param other:      Parameter to compare against.
-		:returns:          ``True``, if version is less than the second operand.
-		:raises TypeError: If parameter ``other`` is not of type :class:`SemanticVersion`.
+		:param other: Parameter to compare against.
+		:returns:     ``True``, if version is less than the second operand. |br|
+		              :data:`NotImplemented`, if parameter ``other`` is not of type :class:`SemanticVersion`.
 		"""
 		if not isinstance(other, SemanticVersion):
-			ex = TypeError(f"Second operand of type '{other.__class__.__name__}' is not supported by < operator.")
-			if version_info >= (3, 11):  # pragma: no cover
-				ex.add_note(f"Supported types for second operand: SemanticVersion")
-			raise ex
+			return NotImplemented
 
-		result = self.__compare(self, other)
-		return result if result is not None else False
+		return self._key < other._key
 
 	def __le__(self, other: Any) -> bool:
 		"""
 		Compare two Version instances (version numbers) if the version is less than or equal to the second operand.
 
-		:param other:      Parameter to compare against.
-		:returns:          ``True``, if version is less than or equal to the second operand.
-		:raises TypeError: If parameter ``other`` is not of type :class:`SemanticVersion`.
+		:param other: Parameter to compare against.
+		:returns:     ``True``, if version is less than or equal to the second operand. |br|
+		              :data:`NotImplemented`, if parameter ``other`` is not of type :class:`SemanticVersion`.
 		"""
 		if not isinstance(other, SemanticVersion):
-			ex = TypeError(f"Second operand of type '{other.__class__.__name__}' is not supported by <= operator.")
-			if version_info >= (3, 11):  # pragma: no cover
-				ex.add_note(f"Supported types for second operand: SemanticVersion")
-			raise ex
+			return NotImplemented
 
-		result = self.__compare(self, other)
-		return result if result is not None else True
+		return self._key <= other._key
 
 	def __gt__(self, other: Any) -> bool:
 		"""
 		Compare two Version instances (version numbers) if the version is greater than the second operand.
 
-		:param other:      Parameter to compare against.
-		:returns:          ``True``, if version is greater than the second operand.
-		:raises TypeError: If parameter ``other`` is not of type :class:`SemanticVersion`.
+		:param other: Parameter to compare against.
+		:returns:     ``True``, if version is greater than the second operand. |br|
+		              :data:`NotImplemented`, if parameter ``other`` is not of type :class:`SemanticVersion`.
 		"""
 		if not isinstance(other, SemanticVersion):
-			ex = TypeError(f"Second operand of type '{other.__class__.__name__}' is not supported by > operator.")
-			if version_info >= (3, 11):  # pragma: no cover
-				ex.add_note(f"Supported types for second operand: SemanticVersion")
-			raise ex
+			return NotImplemented
 
-		return not self.__le__(other)
+		return self._key > other._key
 
 	def __ge__(self, other: Any) -> bool:
 		"""
 		Compare two Version instances (version numbers) if the version is greater than or equal to the second operand.
 
-		:param other:      Parameter to compare against.
-		:returns:          ``True``, if version is greater than or equal to the second operand.
-		:raises TypeError: If parameter ``other`` is not of type :class:`SemanticVersion`.
+		:param other: Parameter to compare against.
+		:returns:     ``True``, if version is greater than or equal to the second operand. |br|
+		              :data:`NotImplemented`, if parameter ``other`` is not of type :class:`SemanticVersion`.
 		"""
 		if not isinstance(other, SemanticVersion):
-			ex = TypeError(f"Second operand of type '{other.__class__.__name__}' is not supported by >= operator.")
-			if version_info >= (3, 11):  # pragma: no cover
-				ex.add_note(f"Supported types for second operand: SemanticVersion")
-			raise ex
+			return NotImplemented
 
-		return not self.__lt__(other)
+		return self._key >= other._key
 
 	def __repr__(self) -> str:
 		"""
 		Return a string representation of this version number without prefix ``v``.
 
+		The string is computed on first access and cached, because version numbers are immutable.
+
 		:returns: Raw version number representation without a prefix.
 		"""
-		return f"{self._major}.{self._minor}.{self._patch}"
+		if self._repr is None:
+			self._repr = f"{self._major}.{self._minor}.{self._patch}"
+
+		return self._repr
 
 	def __str__(self) -> str:
 		"""
 		Return a string representation of this version number with prefix ``v``.
 
+		The string is computed on first access and cached, because version numbers are immutable.
+
 		:returns: Version number representation including a prefix.
 		"""
-		return f"v{self._major}.{self._minor}.{self._patch}"
+		if self._str is None:
+			self._str = f"v{self._major}.{self._minor}.{self._patch}"
+
+		return self._str
 
 
 @export
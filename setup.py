@@ -57,6 +57,7 @@ setup(
 			"packaging": ["setuptools ~= 75.1"],
 			"terminal":  ["colorama ~= 0.4.6"],
 			"yaml":      ["ruamel.yaml ~= 0.18"],
+			"graph":     ["scipy ~= 1.10"],
 		},
 		sourceFileWithVersion=packageInformationFile,
 		dataFiles={
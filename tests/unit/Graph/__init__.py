@@ -74,6 +74,19 @@ class Construction(TestCase):
 		self.assertEqual("<vertex>", repr(root))
 		self.assertEqual("<vertex>", str(root))
 
+	def test_VertexReprCache(self) -> None:
+		graph = Graph()
+		vertex1 = Vertex(vertexID=1, value="one", graph=graph)
+		vertex2 = Vertex(vertexID=2, value=["two"], graph=graph)
+
+		self.assertEqual("<vertex: vertexID='1'; value='one'>", repr(vertex1))
+		vertex1.Value = "uno"
+		self.assertEqual("<vertex: vertexID='1'; value='uno'>", repr(vertex1))
+
+		self.assertEqual("<vertex: vertexID='2'; value='['two']'>", repr(vertex2))
+		vertex2.Value.append("zwei")
+		self.assertEqual("<vertex: vertexID='2'; value='['two', 'zwei']'>", repr(vertex2))
+
 	def test_StandaloneEdge(self) -> None:
 		vertex1 = Vertex()
 		vertex2 = Vertex()
@@ -112,6 +125,120 @@ class Construction(TestCase):
 		with self.assertRaises(NotInSameGraph):
 			Link(vertex1, vertex2)
 
+	def test_StandaloneVerticesConnected(self) -> None:
+		vertex1 = Vertex(vertexID=1)
+		vertex2 = Vertex(vertexID=2)
+		vertex3 = Vertex(vertexID=3)
+
+		edge12 = vertex1.EdgeToVertex(vertex2)
+		self.assertIs(vertex1.Graph, vertex2.Graph)
+		self.assertEqual(2, vertex1.Graph.VertexCount)
+		self.assertEqual(1, vertex1.Graph.EdgeCount)
+		self.assertEqual(1, vertex1.Graph.ComponentCount)
+		self.assertIs(vertex2, edge12.Destination)
+
+		vertex3.EdgeFromVertex(vertex2)
+		self.assertIs(vertex1.Graph, vertex3.Graph)
+		self.assertEqual(3, vertex1.Graph.VertexCount)
+		self.assertEqual(2, vertex1.Graph.EdgeCount)
+
+		with self.assertRaises(DuplicateVertexError):
+			vertex1.EdgeToVertex(Vertex(vertexID=2))
+
+	def test_StandaloneVertexFailedJoin(self) -> None:
+		graph = Graph()
+		vertex1 = Vertex(vertexID=1, graph=graph)
+		vertex2 = Vertex(vertexID=2, graph=graph)
+		vertex1.EdgeToVertex(vertex2)
+		duplicate = Vertex(vertexID=2)
+
+		with self.assertRaises(DuplicateVertexError):
+			vertex1.EdgeToVertex(duplicate)
+
+		self.assertIsNone(duplicate._graph)
+		self.assertIsNone(duplicate._component)
+		self.assertEqual(2, graph.VertexCount)
+		self.assertEqual(1, graph.EdgeCount)
+		self.assertEqual(1, graph.ComponentCount)
+		self.assertSetEqual({vertex1, vertex2}, vertex1.Component._vertices)
+		self.assertIs(vertex2, graph.GetVertexByID(2))
+		self.assertEqual(1, vertex1.OutboundEdgeCount)
+		self.assertEqual(0, duplicate.EdgeCount)
+
+		with self.assertRaises(NotInSameGraph):
+			Edge(duplicate, vertex1)
+		with self.assertRaises(DuplicateVertexError):
+			duplicate.EdgeToVertex(vertex1)
+
+		self.assertEqual(1, graph.EdgeCount)
+		self.assertEqual(1, graph.ComponentCount)
+
+	def test_StandaloneVertexFailedEdge(self) -> None:
+		graph = Graph()
+		vertex1 = Vertex(vertexID=1, graph=graph)
+		vertex2 = Vertex(vertexID=2, graph=graph)
+		vertex2.EdgeToVertex(vertex1, edgeID="e")
+		standalone = Vertex(vertexID=9)
+
+		def assertUnchanged() -> None:
+			self.assertIsNone(standalone._graph)
+			self.assertIsNone(standalone._component)
+			self.assertFalse(graph.HasVertex(standalone))
+			self.assertEqual(2, graph.VertexCount)
+			self.assertEqual(1, graph.EdgeCount)
+			self.assertEqual(1, graph.ComponentCount)
+			self.assertSetEqual({vertex1, vertex2}, vertex1.Component._vertices)
+			self.assertEqual(1, vertex1.InboundEdgeCount)
+			self.assertEqual(1, vertex2.OutboundEdgeCount)
+			self.assertEqual(0, standalone.EdgeCount)
+
+		with self.assertRaises(DuplicateEdgeError):
+			standalone.EdgeToVertex(vertex1, edgeID="e")
+		assertUnchanged()
+		with self.assertRaises(DuplicateEdgeError):
+			standalone.EdgeFromVertex(vertex1, edgeID="e")
+		assertUnchanged()
+		with self.assertRaises(DuplicateEdgeError):
+			vertex1.EdgeToVertex(standalone, edgeID="e")
+		assertUnchanged()
+		with self.assertRaises(TypeError):
+			standalone.EdgeToVertex(vertex1, edgeID=[])
+		assertUnchanged()
+		with self.assertRaises(TypeError):
+			vertex1.EdgeFromVertex(standalone, edgeWeight="5")
+		assertUnchanged()
+
+		subgraph = Subgraph(graph=graph)
+		vertex3 = Vertex(subgraph=subgraph)
+		with self.assertRaises(GraphException):
+			standalone.EdgeToVertex(vertex3)
+		with self.assertRaises(GraphException):
+			vertex3.EdgeFromVertex(standalone)
+		self.assertIsNone(standalone._graph)
+		self.assertEqual(2, graph.VertexCount)
+		self.assertEqual(1, graph.EdgeCount)
+		self.assertEqual(0, vertex3.EdgeCount)
+
+	def test_StandaloneVertexFailedLink(self) -> None:
+		graph = Graph()
+		vertex1 = Vertex(graph=graph)
+		standalone1 = Vertex()
+		standalone2 = Vertex()
+
+		with self.assertRaises(GraphException):
+			standalone1.LinkToVertex(standalone2)
+		with self.assertRaises(GraphException):
+			standalone1.LinkFromVertex(standalone2)
+		with self.assertRaises(GraphException):
+			standalone1.LinkToVertex(vertex1)
+		with self.assertRaises(GraphException):
+			vertex1.LinkFromVertex(standalone1)
+
+		self.assertIsNone(standalone1._graph)
+		self.assertIsNone(standalone2._graph)
+		self.assertEqual(1, graph.VertexCount)
+		self.assertEqual(1, graph.ComponentCount)
+
 	def test_SingleVertexForExistingGraph(self) -> None:
 		graph = Graph()
 
@@ -245,6 +372,65 @@ class Construction(TestCase):
 		# self.assertEqual("", repr(edge12))
 		# self.assertEqual("", str(edge12))
 
+	def test_EdgeToNewVertexWithID(self) -> None:
+		vertex1 = Vertex(vertexID=1)
+
+		vertex2 = vertex1.EdgeToNewVertex(vertexID=2, edgeWeight=5).Destination
+		vertex3 = vertex2.EdgeFromNewVertex(vertexID=3).Source
+
+		self.assertIs(vertex1.Graph, vertex3.Graph)
+		self.assertEqual(3, vertex1.Graph.VertexCount)
+		self.assertEqual(1, vertex1.Graph.ComponentCount)
+		self.assertIs(vertex1.Component, vertex3.Component)
+		self.assertIs(vertex2, vertex1.Graph.GetVertexByID(2))
+
+		graph = vertex1.Graph
+		members = {vertex1, vertex2, vertex3}
+
+		def assertUnchanged() -> None:
+			self.assertEqual(3, graph.VertexCount)
+			self.assertEqual(2, graph.EdgeCount)
+			self.assertEqual(1, graph.ComponentCount)
+			self.assertSetEqual(members, vertex1.Component._vertices)
+
+		with self.assertRaises(DuplicateVertexError):
+			vertex1.EdgeToNewVertex(vertexID=3)
+		assertUnchanged()
+
+		with self.assertRaises(DuplicateVertexError):
+			vertex1.EdgeFromNewVertex(vertexID=2)
+		assertUnchanged()
+
+		with self.assertRaises(TypeError):
+			vertex1.EdgeToNewVertex(edgeWeight="5")
+		assertUnchanged()
+
+		with self.assertRaises(TypeError):
+			vertex1.EdgeFromNewVertex(edgeID=[])
+		assertUnchanged()
+
+		vertex1.EdgeToVertex(vertex3, edgeID="e13")
+		with self.assertRaises(DuplicateEdgeError):
+			vertex1.EdgeToNewVertex(edgeID="e13")
+		self.assertEqual(3, graph.VertexCount)
+		self.assertEqual(3, graph.EdgeCount)
+		self.assertSetEqual(members, vertex1.Component._vertices)
+
+	def test_EdgeToNewVertexInSubgraph(self) -> None:
+		graph = Graph()
+		vertex1 = Vertex(graph=graph)
+		vertex2 = Vertex(subgraph=Subgraph(graph=graph))
+
+		with self.assertRaises(GraphException):
+			vertex2.EdgeToNewVertex()
+		with self.assertRaises(GraphException):
+			vertex2.EdgeFromNewVertex()
+
+		self.assertEqual(1, graph.VertexCount)
+		self.assertEqual(0, graph.EdgeCount)
+		self.assertSetEqual({vertex1}, vertex1.Component._vertices)
+		self.assertSetEqual({vertex2}, vertex2.Component._vertices)
+
 	def test_EdgeFromNewVertex(self) -> None:
 		graph = Graph()
 
@@ -823,6 +1009,20 @@ class Dicts(TestCase):
 		with self.assertRaises(KeyError):
 			_ = vertex["key"]
 
+	def test_VertexDictUnused(self) -> None:
+		graph = Graph()
+		vertex = Vertex(graph=graph)
+
+		self.assertEqual(0, len(vertex))
+		self.assertNotIn("key", vertex)
+		with self.assertRaises(KeyError):
+			_ = vertex["key"]
+		with self.assertRaises(KeyError):
+			del vertex["key"]
+
+		newGraph = graph.CopyVertices()
+		self.assertEqual(0, len(newGraph.GetVertexByID(None)))
+
 	def test_EdgeDict(self) -> None:
 		graph = Graph()
 		vertex1 = Vertex(graph=graph)
@@ -861,6 +1061,16 @@ class EdgesAndLinks(TestCase):
 		self.assertEqual(vertex3, edge34.Source)
 		self.assertEqual(vertex4, edge34.Destination)
 
+	def test_EdgeSlots(self) -> None:
+		graph = Graph()
+		vertex1 = Vertex(graph=graph)
+		vertex2 = Vertex(graph=graph)
+
+		edge12 = vertex1.EdgeToVertex(vertex2)
+		self.assertFalse(hasattr(edge12, "__dict__"))
+		with self.assertRaises(AttributeError):
+			edge12.unknownField = 5
+
 	def test_EdgeToVertexWithID(self) -> None:
 		graph = Graph()
 		subgraph = Subgraph(graph=graph)
@@ -1167,6 +1377,31 @@ class IterateOnGraph(Iterate):
 
 
 class GraphOperations(Iterate):
+	def test_AddEdgesBulk(self) -> None:
+		g1 = Graph()
+		vList1 = [Vertex(vertexID=i, graph=g1) for i in range(0, self._graph1.VertexCount)]
+		for u, v, _ in self._graph1.Edges:
+			vList1[u].EdgeToVertex(vList1[v], edgeWeight=1)
+
+		g2 = Graph()
+		vList2 = [Vertex(vertexID=i, graph=g2) for i in range(0, self._graph1.VertexCount)]
+		g2.AddEdgesBulk(((u, v) for u, v, _ in self._graph1.Edges), weight=1)
+
+		self.assertEqual(g1.EdgeCount, g2.EdgeCount)
+		self.assertEqual(g1.ComponentCount, g2.ComponentCount)
+		for v1, v2 in zip(vList1, vList2):
+			self.assertListEqual([v.ID for v in v1.Successors], [v.ID for v in v2.Successors])
+			self.assertListEqual([v.ID for v in v1.Predecessors], [v.ID for v in v2.Predecessors])
+		for edge in g2.IterateEdges():
+			self.assertIsInstance(edge, Edge)
+			self.assertIsNone(edge.ID)
+			self.assertEqual(1, edge.Weight)
+
+		with self.assertRaises(KeyError):
+			g2.AddEdgesBulk([(0, 100)])
+		with self.assertRaises(TypeError):
+			g2.AddEdgesBulk([(0, 1)], weight="1")
+
 	def test_ReverseEdges(self) -> None:
 		g = Graph()
 		vList = [Vertex(value=i, graph=g) if i % 2 == 0 else Vertex(vertexID=i, value=i, graph=g) for i in range(0, self._graph0.VertexCount)]
@@ -1433,3 +1668,251 @@ class GraphToTree(Iterate):
 
 		self.assertEqual(g.VertexCount, tree.Size)
 		self.assertSetEqual(set([v.Value for v in g.IterateLeafs()]), set([n.Value for n in tree.IterateLeafs()]))
+
+
+class FrozenGraph(Iterate):
+	def test_Freeze(self) -> None:
+		g = Graph()
+		vList = [Vertex(vertexID=i, graph=g) for i in range(0, self._graph1.VertexCount)]
+
+		for u, v, w in self._graph1.Edges:
+			vList[u].EdgeToVertex(vList[v], edgeWeight=w)
+
+		self.assertFalse(g.IsFrozen)
+		g.Freeze()
+		self.assertTrue(g.IsFrozen)
+
+		for vertex in vList:
+			self.assertListEqual(list(vertex.Successors), list(vertex.IterateSuccessorVertices()))
+
+	def test_IterateGraph(self) -> None:
+		g = Graph()
+		vertex0 = Vertex(graph=g)
+		vList = [Vertex(vertexID=i, graph=g) for i in range(1, 4)]
+		vList[0].EdgeToVertex(vList[1])
+
+		self.assertListEqual([vertex0] + vList, list(g))
+		g.Freeze()
+		self.assertListEqual([vertex0] + vList, list(g))
+
+		self.assertTrue(g.HasVertex(vertex0))
+		self.assertFalse(g.HasVertex(Vertex(graph=Graph())))
+		self.assertFalse(g.HasVertex(Vertex(subgraph=Subgraph(graph=g))))
+
+	def test_BFS(self) -> None:
+		g = Graph()
+		vList = [Vertex(vertexID=i, graph=g) for i in range(0, self._graph1.VertexCount)]
+		v0 = vList[0]
+
+		for u, v, w in self._graph1.Edges:
+			vList[u].EdgeToVertex(vList[v], edgeWeight=w)
+
+		unfrozen = {vertex: list(vertex.IterateVerticesBFS()) for vertex in vList}
+		g.Freeze()
+
+		self.assertListEqual([0, 1, 9, 8, 7, 3, 6, 10, 11, 2, 4, 5], [v.ID for v in v0.IterateVerticesBFS()])
+		for vertex in vList:
+			self.assertListEqual(unfrozen[vertex], list(vertex.IterateVerticesBFS()))
+
+	def test_DFS(self) -> None:
+		g = Graph()
+		vList = [Vertex(vertexID=i, graph=g) for i in range(0, self._graph1.VertexCount)]
+
+		for u, v, w in self._graph1.Edges:
+			vList[u].EdgeToVertex(vList[v], edgeWeight=w)
+
+		unfrozen = {vertex: list(vertex.IterateVerticesDFS()) for vertex in vList}
+		g.Freeze()
+
+		for vertex in vList:
+			self.assertListEqual(unfrozen[vertex], list(vertex.IterateVerticesDFS()))
+
+	def test_BFSParallelEdges(self) -> None:
+		g = Graph()
+		v0 = Vertex(vertexID=0, graph=g)
+		v1 = Vertex(vertexID=1, graph=g)
+		v0.EdgeToVertex(v1)
+		v0.EdgeToVertex(v1)
+		v1.EdgeToVertex(v0)
+
+		self.assertListEqual([v0, v1], list(v0.IterateVerticesBFS()))
+		g.Freeze()
+		self.assertListEqual([v0, v1], list(v0.IterateVerticesBFS()))
+
+	def test_Predecessors(self) -> None:
+		g = Graph()
+		vList = [Vertex(vertexID=i, graph=g) for i in range(0, self._graph1.VertexCount)]
+
+		for u, v, w in self._graph1.Edges:
+			vList[u].EdgeToVertex(vList[v], edgeWeight=w)
+
+		g.Freeze()
+
+		for vertex in vList:
+			self.assertListEqual(list(vertex.Predecessors), list(vertex.IteratePredecessorVertices()))
+
+	def test_ShortestPathByHops(self) -> None:
+		g = Graph()
+		vList = [Vertex(vertexID=i, graph=g) for i in range(0, self._graph2.VertexCount)]
+		v0 = vList[0]
+
+		for u, v, w in self._graph2.Edges:
+			vList[u].EdgeToVertex(vList[v], edgeWeight=w)
+
+		g.Freeze()
+
+		self.assertListEqual([0, 2, 7, 11, 14], [v.ID for v in v0.ShortestPathToByHops(vList[14])])
+		with self.assertRaises(DestinationNotReachable):
+			print([v.ID for v in v0.ShortestPathToByHops(vList[9])])
+
+	def test_ShortestPathByWeight(self) -> None:
+		g = Graph()
+		vList = [Vertex(vertexID=i, graph=g) for i in range(0, self._graph2.VertexCount)]
+		v0 = vList[0]
+
+		for u, v, w in self._graph2.Edges:
+			vList[u].EdgeToVertex(vList[v], edgeWeight=w)
+
+		unfrozen = [[(v.ID, w) for v, w in v0.ShortestPathToByWeight(vertex)] for vertex in vList[1:9]]
+		g.Freeze()
+
+		self.assertListEqual([0, 3, 4, 5, 6, 13, 14], [v.ID for v, w in v0.ShortestPathToByWeight(vList[14])])
+		self.assertListEqual(unfrozen, [[(v.ID, w) for v, w in v0.ShortestPathToByWeight(vertex)] for vertex in vList[1:9]])
+		with self.assertRaises(DestinationNotReachable):
+			print([v.ID for v, w in v0.ShortestPathToByWeight(vList[9])])
+
+		edge = v0.OutboundEdges[0]
+		edge.Weight = 100
+		self.assertTrue(g.IsFrozen)
+		self.assertEqual(100, g._GetCSRWeights()[0])
+
+	def test_ReorderByRCM(self) -> None:
+		g = Graph()
+		vList = [Vertex(vertexID=i, graph=g) for i in range(0, self._graph2.VertexCount)]
+
+		for u, v, w in self._graph2.Edges:
+			vList[u].EdgeToVertex(vList[v], edgeWeight=w)
+
+		bfs = {vertex: list(vertex.IterateVerticesBFS()) for vertex in vList}
+		dfs = {vertex: list(vertex.IterateVerticesDFS()) for vertex in vList}
+		g.ReorderByRCM()
+		self.assertTrue(g.IsFrozen)
+
+		self.assertListEqual(list(range(len(vList))), sorted(vertex._index for vertex in vList))
+		for vertex in vList:
+			self.assertListEqual(bfs[vertex], list(vertex.IterateVerticesBFS()))
+			self.assertListEqual(dfs[vertex], list(vertex.IterateVerticesDFS()))
+			self.assertListEqual(list(vertex.Successors), list(vertex.IterateSuccessorVertices()))
+			self.assertListEqual(list(vertex.Predecessors), list(vertex.IteratePredecessorVertices()))
+
+	def test_ReorderByRCMBandwidth(self) -> None:
+		g = Graph()
+		# A path graph 0 -> 1 -> ... -> 9 inserted in scattered order.
+		vList = [Vertex(vertexID=i, graph=g) for i in (0, 5, 2, 8, 1, 9, 3, 6, 4, 7)]
+		vertices = {vertex.ID: vertex for vertex in vList}
+		for i in range(9):
+			vertices[i].EdgeToVertex(vertices[i + 1])
+
+		g.ReorderByRCM()
+
+		bandwidth = max(abs(vertices[i]._index - vertices[i + 1]._index) for i in range(9))
+		self.assertEqual(1, bandwidth)
+
+	def test_ToScipyCSR(self) -> None:
+		from scipy.sparse.csgraph import dijkstra
+
+		g = Graph()
+		vList = [Vertex(vertexID=i, graph=g) for i in range(0, self._graph2.VertexCount)]
+		v0 = vList[0]
+
+		for u, v, w in self._graph2.Edges:
+			vList[u].EdgeToVertex(vList[v], edgeWeight=w)
+
+		matrix = g.ToScipyCSR()
+		self.assertTrue(g.IsFrozen)
+		self.assertEqual((len(vList), len(vList)), matrix.shape)
+		self.assertEqual(g.EdgeCount, matrix.nnz)
+		cached = g.ToScipyCSR()
+		self.assertIsNot(matrix, cached)
+		self.assertEqual(0, (matrix != cached).nnz)
+
+		matrix[vList[0].Index, vList[1].Index] = 100
+		self.assertNotEqual(100, g.ToScipyCSR()[vList[0].Index, vList[1].Index])
+
+		distances = dijkstra(matrix, indices=v0.Index)
+		self.assertEqual(12, distances[vList[14].Index])
+
+		edge = vList[0].OutboundEdges[0]
+		edge.Weight = 100
+		matrix = g.ToScipyCSR()
+		self.assertEqual(100, matrix[edge.Source.Index, edge.Destination.Index])
+
+		vList[0].EdgeToVertex(vList[9])
+		self.assertIsNone(v0.Index)
+		self.assertEqual(g.EdgeCount, g.ToScipyCSR().nnz)
+
+	def test_ToScipyCSRParallelEdges(self) -> None:
+		from scipy.sparse.csgraph import dijkstra
+
+		g = Graph()
+		v0 = Vertex(graph=g)
+		v1 = Vertex(graph=g)
+		v2 = Vertex(graph=g)
+		v0.EdgeToVertex(v1, edgeWeight=5)
+		v0.EdgeToVertex(v1, edgeWeight=3)
+		v0.EdgeToVertex(v1)
+		v1.EdgeToVertex(v2, edgeWeight=4)
+
+		matrix = g.ToScipyCSR(defaultWeight=7)
+		self.assertEqual(2, matrix.nnz)
+		self.assertEqual(3, matrix[v0.Index, v1.Index])
+		self.assertEqual(4, matrix[v1.Index, v2.Index])
+
+		distances = dijkstra(matrix, indices=v0.Index)
+		self.assertEqual(3, distances[v1.Index])
+		self.assertEqual(7, distances[v2.Index])
+
+		self.assertEqual(2, g.ToScipyCSR(defaultWeight=2)[v0.Index, v1.Index])
+
+	def test_RootsAndLeafs(self) -> None:
+		g = Graph()
+		vList = [Vertex(value=i, graph=g) if i % 2 == 0 else Vertex(vertexID=i, value=i, graph=g) for i in range(0, self._graph0.VertexCount)]
+
+		for u, v, w in self._graph0.Edges:
+			vList[u].EdgeToVertex(vList[v], edgeWeight=w)
+
+		g.Freeze()
+
+		self.assertSetEqual({2, 4, 13}, set(v.Value for v in g.IterateRoots()))
+		self.assertSetEqual({2, 4},     set(v.Value for v in g.IterateRoots(predicate=lambda v: v.Value % 2 == 0)))
+		self.assertSetEqual({11, 12, 14}, set(v.Value for v in g.IterateLeafs()))
+		self.assertSetEqual({12, 14},     set(v.Value for v in g.IterateLeafs(predicate=lambda v: v.Value % 2 == 0)))
+
+		vList[14].EdgeToVertex(vList[2])
+		self.assertSetEqual({4, 13}, set(v.Value for v in g.IterateRoots()))
+		self.assertSetEqual({11, 12}, set(v.Value for v in g.IterateLeafs()))
+
+	def test_ModificationUnfreezes(self) -> None:
+		g = Graph()
+		vList = [Vertex(vertexID=i, graph=g) for i in range(0, self._graph1.VertexCount)]
+
+		for u, v, w in self._graph1.Edges:
+			vList[u].EdgeToVertex(vList[v], edgeWeight=w)
+
+		g.Freeze()
+		vList[0].EdgeToVertex(vList[13])
+		self.assertFalse(g.IsFrozen)
+		self.assertListEqual([vList[1], vList[9], vList[13]], list(vList[0].IterateSuccessorVertices()))
+
+		g.Freeze()
+		vList[0].DeleteEdgeTo(vList[13])
+		self.assertFalse(g.IsFrozen)
+
+		g.Freeze()
+		Vertex(graph=g)
+		self.assertFalse(g.IsFrozen)
+
+		g.Freeze()
+		g.ReverseEdges()
+		self.assertFalse(g.IsFrozen)
+		self.assertListEqual([vList[3], vList[12]], list(vList[2].IterateSuccessorVertices()))
@@ -36,6 +36,7 @@ This test suite tests decorators:
 * :func:`@abstractmethod <pyTooling.MetaClasses.abstractmethod>`
 * :func:`@mustoverride <pyTooling.MetaClasses.mustoverride>`
 """
+from re                    import escape
 from unittest              import TestCase
 
 from pyTooling.Decorators  import notimplemented
@@ -48,7 +49,16 @@ if __name__ == "__main__":  # pragma: no cover
 	exit(1)
 
 
-class AbstractMethod(TestCase):
+class AbstractClassErrorAssertion:
+	"""Mixin class for test cases checking if instantiating an abstract class raises an :exc:`AbstractClassError`."""
+
+	def _assertRaisesAbstract(self, cls: type, className: str, methodName: str, *args) -> None:
+		# The exception message names the abstract class first, followed by the list of abstract methods.
+		with self.assertRaisesRegex(AbstractClassError, f"(?s){escape(className)}.*{escape(methodName)}"):
+			cls(*args)
+
+
+class AbstractMethod(TestCase, AbstractClassErrorAssertion):
 	def test_AbstractBase(self) -> None:
 		class AbstractBase(metaclass=ExtendedType):
 			_data: int
@@ -60,11 +70,7 @@ class AbstractMethod(TestCase):
 			def AbstractMethod(self) -> bool:
 				return False
 
-		with self.assertRaises(AbstractClassError) as ExceptionCapture:
-			AbstractBase(1)
-
-		self.assertIn("AbstractBase", str(ExceptionCapture.exception))
-		self.assertIn("AbstractMethod", str(ExceptionCapture.exception))
+		self._assertRaisesAbstract(AbstractBase, "AbstractBase", "AbstractMethod", 1)
 
 	def test_AbstractClass(self) -> None:
 		class AbstractBase(metaclass=ExtendedType):
@@ -80,11 +86,7 @@ class AbstractMethod(TestCase):
 		class AbstractClass(AbstractBase):
 			pass
 
-		with self.assertRaises(AbstractClassError) as ExceptionCapture:
-			AbstractClass(2)
-
-		self.assertIn("AbstractClass", str(ExceptionCapture.exception))
-		self.assertIn("AbstractMethod", str(ExceptionCapture.exception))
+		self._assertRaisesAbstract(AbstractClass, "AbstractClass", "AbstractMethod", 2)
 
 	def test_DerivedAbstractBase(self) -> None:
 		class AbstractBase(metaclass=ExtendedType):
@@ -180,18 +182,14 @@ class AbstractMethod(TestCase):
 		derived.AbstractMethod()
 
 
-class MustOverride(TestCase):
+class MustOverride(TestCase, AbstractClassErrorAssertion):
 	def test_MustOverrideBase(self) -> None:
 		class MustOverrideBase(metaclass=ExtendedType):
 			@mustoverride
 			def MustOverrideMethod(self) -> bool:
 				return False
 
-		with self.assertRaises(AbstractClassError) as ExceptionCapture:
-			MustOverrideBase()
-
-		self.assertIn("MustOverrideBase", str(ExceptionCapture.exception))
-		self.assertIn("MustOverrideMethod", str(ExceptionCapture.exception))
+		self._assertRaisesAbstract(MustOverrideBase, "MustOverrideBase", "MustOverrideMethod")
 
 	def test_MustOverrideClass(self) -> None:
 		class MustOverrideBase(metaclass=ExtendedType):
@@ -202,11 +200,7 @@ class MustOverride(TestCase):
 		class MustOverrideClass(MustOverrideBase):
 			pass
 
-		with self.assertRaises(AbstractClassError) as ExceptionCapture:
-			MustOverrideClass()
-
-		self.assertIn("MustOverrideClass", str(ExceptionCapture.exception))
-		self.assertIn("MustOverrideMethod", str(ExceptionCapture.exception))
+		self._assertRaisesAbstract(MustOverrideClass, "MustOverrideClass", "MustOverrideMethod")
 
 	def test_DerivedMustOverride(self) -> None:
 		class MustOverrideBase(metaclass=ExtendedType):
@@ -29,6 +29,7 @@
 # ==================================================================================================================== #
 #
 """Unit tests for package :mod:`pyTooling.Versioning`."""
+from operator             import lt, le, gt, ge
 from unittest             import TestCase
 
 from pyTooling.Versioning import SemanticVersion
@@ -61,6 +62,30 @@ class Version(TestCase):
 		self.assertEqual(version.Patch, 0, "Patch number is not 0.")
 		self.assertEqual(version.Build, 0, "Build number is not 0.")
 
+	def test_CreateFromString2(self) -> None:
+		l = [
+			("1", (1, 0, 0, 0)),
+			("1.2", (1, 2, 0, 0)),
+			("1.2.3", (1, 2, 3, 0)),
+			("1.2.3.4", (1, 2, 3, 4)),
+			("v1.2.3", (1, 2, 3, 0)),
+			("i1.2.3", (1, 2, 3, 0)),
+			("r1.2.3", (1, 2, 3, 0)),
+			("rev1.2.3", (1, 2, 3, 0)),
+			("REV1.2.3", (1, 2, 3, 0)),
+		]
+
+		for versionString, expected in l:
+			with self.subTest(version=versionString):
+				version = SemanticVersion.Parse(versionString)
+				self.assertTupleEqual(expected, (version.Major, version.Minor, version.Patch, version.Build))
+
+	def test_CreateFromInvalidString(self) -> None:
+		for versionString in ("v", "1.", "1.2.3.4.5", "1.2-dev", "x1.2.3", "1.2.3\n"):
+			with self.subTest(version=versionString):
+				with self.assertRaises(ValueError):
+					SemanticVersion.Parse(versionString)
+
 	def test_CreateFromIntegers1(self) -> None:
 		version = SemanticVersion(0, 0, 0)
 
@@ -77,6 +102,13 @@ class Version(TestCase):
 		self.assertEqual(version.Patch, 3, "Patch number is not 3.")
 		self.assertEqual(version.Build, 4, "Build number is not 4.")
 
+	def test_Slots(self) -> None:
+		version = SemanticVersion(1, 2, 3, 4)
+
+		self.assertFalse(hasattr(version, "__dict__"))
+		with self.assertRaises(AttributeError):
+			version.unknownField = 5
+
 	def test_Equal(self) -> None:
 		l = [
 			("0.0.0", "0.0.0"),
@@ -112,13 +144,41 @@ class Version(TestCase):
 				v2 = SemanticVersion.Parse(t[1])
 				self.assertNotEqual(v1, v2)
 
+	def test_String(self) -> None:
+		version = SemanticVersion.Parse("v1.2.3.4")
+
+		self.assertEqual("1.2.3", repr(version))
+		self.assertEqual("v1.2.3", str(version))
+		self.assertIs(str(version), str(version))
+
+	def test_CompareWithOtherTypes(self) -> None:
+		version = SemanticVersion(1, 2, 3)
+
+		self.assertFalse(version == "1.2.3")
+		self.assertTrue(version != (1, 2, 3))
+		for operator in (lt, le, gt, ge):
+			with self.subTest(operator=operator.__name__):
+				with self.assertRaises(TypeError):
+					operator(version, 1)
+
+	def test_Hash(self) -> None:
+		v1 = SemanticVersion.Parse("1.2.3")
+		v2 = SemanticVersion(1, 2, 3)
+		v3 = SemanticVersion.Parse("1.2.4")
+
+		self.assertEqual(hash(v1), hash(v2))
+		self.assertEqual(2, len({v1, v2, v3}))
+		self.assertEqual("b", {v1: "a", v3: "c", v2: "b"}[SemanticVersion(1, 2, 3, 0)])
+
 	def test_LessThan(self) -> None:
 		l = [
 			("0.0.0", "0.0.1"),
 			("0.0.0", "0.1.0"),
 			("0.0.0", "1.0.0"),
 			("0.0.1", "0.1.0"),
-			("0.1.0", "1.0.0")
+			("0.1.0", "1.0.0"),
+			("1.2.3.4", "1.2.3.5"),
+			("1.2.3", "1.2.3.1")
 		]
 
 		for t in l: